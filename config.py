@@ -1,7 +1,9 @@
 """
 Configuration and settings for Scanify.
 """
-from dataclasses import dataclass
+from collections import namedtuple
+from dataclasses import dataclass, fields
+from types import MappingProxyType
 from typing import Tuple
 
 
@@ -24,21 +26,7 @@ class EffectConfig:
 
     def to_dict(self):
         """Convert to dictionary."""
-        return {
-            'dpi': self.dpi,
-            'jpg_quality': self.jpg_quality,
-            'lighting': self.lighting,
-            'tilt_randomness': self.tilt_randomness,
-            'wrinkles': self.wrinkles,
-            'shadows': self.shadows,
-            'warp': self.warp,
-            'noise': self.noise,
-            'paper_texture': self.paper_texture,
-            'page_edge': self.page_edge,
-            'yellowness': self.yellowness,
-            'black_and_white': self.black_and_white,
-            'blank_metadata': self.blank_metadata
-        }
+        return {f.name: getattr(self, f.name) for f in fields(self)}
 
 
 # UI Constants
@@ -64,22 +52,26 @@ COLOR_INPUT_BG = "#f4f4f4"  # Matte input
 COLOR_BORDER = "#cccccc"  # Flat border
 
 # Slider Ranges
-SLIDER_RANGES = {
-    'dpi': (50, 150, 10),  # Lower minimum for more degradation
-    'jpg_quality': (20, 100, 10),  # Lower minimum for more compression artifacts
-    'lighting': (0, 1, 0.05),
-    'tilt_randomness': (0, 1, 0.05),
-    'wrinkles': (0, 1, 0.05),
-    'shadows': (0, 1, 0.05),
-    'warp': (0, 1, 0.05),
-    'noise': (0, 1, 0.05),
-    'paper_texture': (0, 1, 0.05),
-    'page_edge': (0, 1, 0.05),
-    'yellowness': (0, 1, 0.05),
-}
+SliderSpec = namedtuple('SliderSpec', 'lo hi step')
+
+SLIDER_RANGES = MappingProxyType({
+    'dpi': SliderSpec(50, 150, 10),  # Lower minimum for more degradation
+    'jpg_quality': SliderSpec(20, 100, 10),  # Lower minimum for more compression artifacts
+    'lighting': SliderSpec(0, 1, 0.05),
+    'tilt_randomness': SliderSpec(0, 1, 0.05),
+    'wrinkles': SliderSpec(0, 1, 0.05),
+    'shadows': SliderSpec(0, 1, 0.05),
+    'warp': SliderSpec(0, 1, 0.05),
+    'noise': SliderSpec(0, 1, 0.05),
+    'paper_texture': SliderSpec(0, 1, 0.05),
+    'page_edge': SliderSpec(0, 1, 0.05),
+    'yellowness': SliderSpec(0, 1, 0.05),
+})
 
 # Processing Constants
 MAX_PREVIEW_DIMENSION = 2200
+MAX_CONVERT_WORKERS = 4  # PDFs converted in parallel per batch
+CONVERT_BATCH_PAGES = 16  # Pages held in memory before flushing to the output PDF
 QUEUE_HEIGHT = 220
 PREVIEW_HEIGHT = 280
 ACTIVITY_HEIGHT = 220
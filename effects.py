@@ -2,8 +2,12 @@
 Scan effect implementations for realistic scanner simulation.
 """
 import numpy as np
-from PIL import Image, ImageDraw, ImageFilter, ImageEnhance
+from PIL import Image, ImageFilter, ImageEnhance
 import random
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+
+from config import MAX_PREVIEW_DIMENSION
 
 try:
     import cv2
@@ -11,19 +15,80 @@ try:
 except ImportError:
     HAS_OPENCV = False
 
+# GPU remap is only available in CUDA-enabled OpenCV builds (not the PyPI wheels)
+try:
+    HAS_OPENCV_CUDA = HAS_OPENCV and cv2.cuda.getCudaEnabledDeviceCount() > 0
+except Exception:
+    HAS_OPENCV_CUDA = False
+
+# Below this size the host<->device upload costs more than the CPU remap
+CUDA_MIN_PIXELS = 1500 * 1500
+
+# Counts the 8 neighbours of each pixel
+_NEIGHBOUR_KERNEL = np.array([[1, 1, 1], [1, 0, 1], [1, 1, 1]], dtype=np.float32)
+
+# Wrinkle, shadow and grain masks don't depend on the pixels - build them in parallel.
+# NumPy and OpenCV release the GIL for the heavy parts.
+_MASK_POOL = ThreadPoolExecutor(max_workers=3, thread_name_prefix="scanify-masks")
+
+# Real paper has cream/ivory/yellowish tint - more visible
+PAPER_TINT = np.array([248, 246, 238], dtype=np.float32)  # Yellowish cream
+# Yellow tint: [255, 255, 200]
+YELLOW_TINT = np.array([255, 255, 200], dtype=np.float32)
+
+
+def set_mask_workers(count: int):
+    """Resize the mask thread pool (page-worker processes use 1 so they don't oversubscribe the CPU)."""
+    global _MASK_POOL
+    old_pool = _MASK_POOL
+    _MASK_POOL = ThreadPoolExecutor(max_workers=count, thread_name_prefix="scanify-masks")
+    old_pool.shutdown(wait=False)
+
+
+@lru_cache(maxsize=4)
+def _coordinate_grid(height: int, width: int):
+    """Float32 (row, column) coordinate vectors that broadcast to a height x width grid.
+
+    Cached per size because every page of a document shares the same dimensions.
+    """
+    y_grid = np.arange(height, dtype=np.float32)[:, None]
+    x_grid = np.arange(width, dtype=np.float32)[None, :]
+    y_grid.flags.writeable = False
+    x_grid.flags.writeable = False
+    return y_grid, x_grid
+
+
+def _to_float(image) -> np.ndarray:
+    """Copy an RGB image into a float32 working buffer."""
+    return np.array(image, dtype=np.float32)
+
+
+def _to_image(img_array: np.ndarray) -> Image.Image:
+    """Convert a clipped float32 working buffer back to an RGB image."""
+    return Image.fromarray(img_array.astype(np.uint8))
+
 
 def apply_paper_color(image: Image.Image) -> Image.Image:
     """Add realistic paper color - paper is never pure white, has yellowish tint."""
-    img_array = np.array(image, dtype=np.float32)
+    return _to_image(_paper_tone_array(_to_float(image), 0.0))
+
 
-    # Real paper has cream/ivory/yellowish tint - more visible
-    paper_tint = np.array([248, 246, 238], dtype=np.float32)  # Yellowish cream
+def _paper_tone_array(img_array: np.ndarray, yellowness: float) -> np.ndarray:
+    """Paper color followed by yellowness as one fused affine pass (in place).
 
+    Both steps are convex blends towards a fixed color, so
+    ((x * 0.85 + paper * 0.15) * (1 - b) + yellow * b) collapses to a single
+    scale and offset per channel.
+    """
+    blend = yellowness * 0.7  # Max 70% yellow
     # Blend with paper color (noticeable but not overwhelming)
-    result = img_array * 0.85 + paper_tint * 0.15
-    result = np.clip(result, 0, 255).astype(np.uint8)
+    scale = 0.85 * (1 - blend)
+    offset = PAPER_TINT * (0.15 * (1 - blend)) + YELLOW_TINT * blend
+    img_array *= scale
+    img_array += offset
+    np.clip(img_array, 0, 255, out=img_array)
 
-    return Image.fromarray(result)
+    return img_array
 
 
 def apply_scan_effects(image: Image.Image, config) -> Image.Image:
@@ -35,35 +100,45 @@ def apply_scan_effects(image: Image.Image, config) -> Image.Image:
         config: EffectConfig with effect parameters
 
     Returns:
-        Processed PIL Image
+        Processed PIL Image. Pages larger than MAX_PREVIEW_DIMENSION are returned at the
+        reduced processing size - upscaling again would only blur the effects.
     """
     # Convert to RGB if needed
     if image.mode != 'RGB':
         image = image.convert('RGB')
 
+    return Image.fromarray(apply_scan_effects_array(np.asarray(image), config))
+
+
+def apply_scan_effects_array(img_array: np.ndarray, config) -> np.ndarray:
+    """
+    Array version of apply_scan_effects - takes and returns (H, W, 3) uint8 RGB arrays.
+
+    Lets callers holding raw pixels (e.g. a PyMuPDF pixmap) skip the PIL round trips
+    at both ends of the pipeline. The input array is never modified.
+    """
     # Get dimensions
-    width, height = image.size
+    height, width = img_array.shape[:2]
 
     # Scale down for processing if too large
-    max_dim = 2200
-    scale_factor = 1.0
+    max_dim = MAX_PREVIEW_DIMENSION
     if max(width, height) > max_dim:
         scale_factor = max_dim / max(width, height)
         new_width = int(width * scale_factor)
         new_height = int(height * scale_factor)
-        image = image.resize((new_width, new_height), Image.Resampling.LANCZOS)
-        width, height = new_width, new_height
+        img_array = np.asarray(Image.fromarray(img_array).resize((new_width, new_height), Image.Resampling.LANCZOS))
 
     # Add realistic paper color first (unless B&W)
     if not config.black_and_white:
-        image = apply_paper_color(image)
-        # Apply yellowness effect
-        if hasattr(config, 'yellowness') and config.yellowness > 0.01:
-            image = apply_yellowness(image, config.yellowness)
+        # Apply yellowness effect in the same pass
+        yellowness = getattr(config, 'yellowness', 0.0)
+        if yellowness <= 0.01:
+            yellowness = 0.0
+        image = _to_image(_paper_tone_array(_to_float(img_array), yellowness))
 
     # Apply color mode conversion if B&W
     if config.black_and_white:
-        image = apply_black_and_white(image)
+        image = apply_black_and_white(Image.fromarray(img_array))
 
     # Apply tilt effect (random rotation)
     if hasattr(config, 'tilt_randomness') and config.tilt_randomness > 0.01:
@@ -72,37 +147,53 @@ def apply_scan_effects(image: Image.Image, config) -> Image.Image:
     if config.warp > 0.01:
         image = apply_warp(image, config.warp)
 
-    # Apply lighting gradient
-    if config.lighting > 0.01:
-        image = apply_lighting(image, config.lighting)
+    # Lighting, wrinkles, shadows and texture share one float32 buffer
+    img_array = _to_float(image)
+    height, width = img_array.shape[:2]
 
-    # Apply wrinkles
+    # Start building the masks on worker threads while lighting runs here
+    wrinkle_job = shadow_job = grain_job = None
     if config.wrinkles > 0.01:
-        image = apply_wrinkles(image, config.wrinkles)
+        wrinkle_job = _MASK_POOL.submit(_wrinkle_mask, height, width, config.wrinkles)
+    if config.shadows > 0.01:
+        shadow_job = _MASK_POOL.submit(_shadow_mask, height, width, config.shadows)
+    if config.paper_texture > 0.01:
+        grain_job = _MASK_POOL.submit(_grain_layer, height, width, config.paper_texture)
+
+    # Apply lighting gradient (can brighten past white, so it is clipped on its own)
+    if config.lighting > 0.01:
+        img_array = _lighting_array(img_array, config.lighting)
+
+    # Wrinkles and shadows only darken - combine them into one mask, apply once
+    brightness_mask = None
+    if wrinkle_job:
+        brightness_mask = wrinkle_job.result()
+    if shadow_job:
+        shadow_mask = shadow_job.result()
+        if brightness_mask is None:
+            brightness_mask = shadow_mask
+        else:
+            brightness_mask *= shadow_mask
+    if brightness_mask is not None:
+        img_array *= brightness_mask[:, :, None]
 
     # Apply paper texture
-    if config.paper_texture > 0.01:
-        image = apply_paper_texture(image, config.paper_texture)
+    if grain_job:
+        img_array = _add_grain(img_array, grain_job.result())
 
-    # Apply shadows
-    if config.shadows > 0.01:
-        image = apply_shadows(image, config.shadows, config.tilt_randomness)
+    image = _to_image(img_array)
 
     # Apply page edge
     if config.page_edge > 0.01:
         image = apply_page_edge(image, config.page_edge, config.tilt_randomness)
 
     # Apply noise last
+    if config.noise > 0.01 and HAS_OPENCV:
+        return _noise_uint8(np.asarray(image), config.noise)
     if config.noise > 0.01:
         image = apply_noise(image, config.noise)
 
-    # Scale back up if we scaled down
-    if scale_factor != 1.0:
-        original_width = int(width / scale_factor)
-        original_height = int(height / scale_factor)
-        image = image.resize((original_width, original_height), Image.Resampling.LANCZOS)
-
-    return image
+    return np.asarray(image)
 
 
 def apply_black_and_white(image: Image.Image) -> Image.Image:
@@ -121,47 +212,38 @@ def apply_black_and_white(image: Image.Image) -> Image.Image:
             cv2.THRESH_BINARY + cv2.THRESH_OTSU
         )
 
-        # Slight denoising to clean up
-        binary = cv2.fastNlMeansDenoising(binary, None, 10, 7, 21)
+        # Slight cleanup - flip isolated pixels whose 8 neighbours all disagree.
+        # Unlike a median or opening this keeps 1px text strokes intact.
+        ink = (binary == 0).astype(np.uint8)
+        neighbours = cv2.filter2D(ink, -1, _NEIGHBOUR_KERNEL, borderType=cv2.BORDER_REPLICATE)
+        binary[(ink == 1) & (neighbours == 0)] = 255
+        binary[(ink == 0) & (neighbours == 8)] = 0
 
         # Convert back to RGB
         result = cv2.cvtColor(binary, cv2.COLOR_GRAY2RGB)
         return Image.fromarray(result)
     else:
         # Better fallback with auto threshold
-        hist = gray.histogram()
-        total = sum(hist)
-
-        # Calculate optimal threshold using Otsu-like method
-        current_max, threshold = 0, 0
-        sum_total, sum_foreground = 0, 0
-        weight_background, weight_foreground = 0, 0
-
-        for i in range(256):
-            sum_total += i * hist[i]
+        gray_array = np.asarray(gray)
+        hist = np.bincount(gray_array.ravel(), minlength=256).astype(np.float64)
 
-        for i in range(256):
-            weight_background += hist[i]
-            if weight_background == 0:
-                continue
-
-            weight_foreground = total - weight_background
-            if weight_foreground == 0:
-                break
-
-            sum_foreground += i * hist[i]
+        # Calculate optimal threshold using Otsu's method over the cumulative histogram
+        weight_background = np.cumsum(hist)
+        weight_foreground = weight_background[-1] - weight_background
+        sum_foreground = np.cumsum(np.arange(256) * hist)
+        sum_total = sum_foreground[-1]
 
+        with np.errstate(divide='ignore', invalid='ignore'):
             mean_background = sum_foreground / weight_background
             mean_foreground = (sum_total - sum_foreground) / weight_foreground
-
             between_variance = weight_background * weight_foreground * (mean_background - mean_foreground) ** 2
 
-            if between_variance > current_max:
-                current_max = between_variance
-                threshold = i
+        valid = (weight_background > 0) & (weight_foreground > 0)
+        between_variance = np.where(valid, between_variance, 0)
+        threshold = int(np.argmax(between_variance))
 
         # Apply threshold
-        binary = gray.point(lambda x: 255 if x > threshold else 0, mode='L')
+        binary = Image.fromarray(np.where(gray_array > threshold, 255, 0).astype(np.uint8))
         return binary.convert('RGB')
 
 
@@ -169,19 +251,27 @@ def apply_lighting(image: Image.Image, intensity: float) -> Image.Image:
     """Apply realistic uneven lighting - scanners have non-uniform light distribution."""
     if intensity < 0.01:
         return image
+    return _to_image(_lighting_array(_to_float(image), intensity))
 
-    width, height = image.size
-    img_array = np.array(image, dtype=np.float32)
 
-    # Create lighting gradient
-    lighting = np.ones((height, width), dtype=np.float32)
+def _lighting_array(img_array: np.ndarray, intensity: float) -> np.ndarray:
+    """Lighting gradient on a float32 buffer (in place)."""
+    height, width = img_array.shape[:2]
 
     # Scanner light typically brighter in center
     center_x = width * random.uniform(0.45, 0.55)
     center_y = height * random.uniform(0.4, 0.6)
 
-    # Create coordinate grids
-    y_grid, x_grid = np.mgrid[0:height, 0:width]
+    # The falloff is very smooth - evaluate it at quarter resolution and upscale
+    if HAS_OPENCV and min(height, width) >= 256:
+        small_height, small_width = height // 4, width // 4
+    else:
+        small_height, small_width = height, width
+
+    # Create coordinate grids (sample positions in full-resolution pixels)
+    y_grid, x_grid = _coordinate_grid(small_height, small_width)
+    y_grid = (y_grid + 0.5) * (height / small_height) - 0.5
+    x_grid = (x_grid + 0.5) * (width / small_width) - 0.5
 
     # Calculate distance from light center
     distances = np.sqrt((x_grid - center_x) ** 2 + (y_grid - center_y) ** 2)
@@ -194,25 +284,27 @@ def apply_lighting(image: Image.Image, intensity: float) -> Image.Image:
     # Invert so 0 is dark, 1 is bright
     base = 0.5 + intensity * 0.5  # 0.5 to 1.0
     brightness_variation = base + (intensity * 0.25 * (1.0 - norm_dist)) - (intensity * 0.15)
-    lighting = brightness_variation
+    lighting = brightness_variation.astype(np.float32)
+    if lighting.shape != (height, width):
+        lighting = cv2.resize(lighting, (width, height), interpolation=cv2.INTER_LINEAR)
+
+    # Slightly warm scanner lamp - applied to all channels in one pass
+    warm = np.array([1.02, 1.01, 0.96], dtype=np.float32)
+    img_array *= lighting[:, :, None]
+    img_array *= warm
+    np.clip(img_array, 0, 255, out=img_array)
 
-    r_channel = img_array[:, :, 0] * lighting * 1.02
-    g_channel = img_array[:, :, 1] * lighting * 1.01
-    b_channel = img_array[:, :, 2] * lighting * 0.96
+    return img_array
 
-    result = np.stack([r_channel, g_channel, b_channel], axis=2)
-    result = np.clip(result, 0, 255).astype(np.uint8)
 
-    return Image.fromarray(result)
 def apply_yellowness(image: Image.Image, intensity: float) -> Image.Image:
     """Blend yellow tint based on intensity. Lower = whiter, higher = yellow."""
-    img_array = np.array(image, dtype=np.float32)
-    # Yellow tint: [255, 255, 200]
-    yellow = np.array([255, 255, 200], dtype=np.float32)
+    img_array = _to_float(image)
     blend = intensity * 0.7  # Max 70% yellow
-    result = img_array * (1 - blend) + yellow * blend
-    result = np.clip(result, 0, 255).astype(np.uint8)
-    return Image.fromarray(result)
+    img_array *= (1 - blend)
+    img_array += YELLOW_TINT * blend
+    np.clip(img_array, 0, 255, out=img_array)
+    return _to_image(img_array)
 def apply_tilt(image: Image.Image, intensity: float) -> Image.Image:
     """Apply random tilt/rotation to simulate page misalignment."""
     if intensity < 0.01:
@@ -230,7 +322,7 @@ def apply_warp(image: Image.Image, intensity: float) -> Image.Image:
     img_array = np.array(image)
 
     # Create mesh grid
-    y_grid, x_grid = np.mgrid[0:height, 0:width]
+    y_grid, x_grid = _coordinate_grid(height, width)
 
     # Real paper warping - RANDOM for each page
     wave_intensity = intensity * random.uniform(15, 35)  # Random warp strength
@@ -250,29 +342,76 @@ def apply_warp(image: Image.Image, intensity: float) -> Image.Image:
     # Add slight barrel distortion - RANDOM
     center_x, center_y = width / 2, height / 2
     distortion = intensity * random.uniform(0.0005, 0.0015)
-    dx += (x_grid - center_x) * distortion
-    dy += (y_grid - center_y) * distortion
+    dx = dx + (x_grid - center_x) * distortion
+    dy = dy + (y_grid - center_y) * distortion
 
     # Create displacement map
     new_x = np.clip(x_grid + dx, 0, width - 1).astype(np.float32)
     new_y = np.clip(y_grid + dy, 0, height - 1).astype(np.float32)
 
     if HAS_OPENCV:
-        result = cv2.remap(img_array, new_x, new_y, cv2.INTER_LINEAR)
+        if HAS_OPENCV_CUDA and width * height >= CUDA_MIN_PIXELS:
+            result = _remap_cuda(img_array, new_x, new_y)
+        else:
+            result = cv2.remap(img_array, new_x, new_y, cv2.INTER_LINEAR)
         return Image.fromarray(result)
     else:
         # Fallback: just return original
         return image
 
 
+def _remap_cuda(img_array: np.ndarray, map_x: np.ndarray, map_y: np.ndarray) -> np.ndarray:
+    """Bilinear cv2.remap on the GPU, falling back to the CPU if the device call fails."""
+    try:
+        gpu_src, gpu_x, gpu_y = cv2.cuda_GpuMat(), cv2.cuda_GpuMat(), cv2.cuda_GpuMat()
+        gpu_src.upload(img_array)
+        gpu_x.upload(map_x)
+        gpu_y.upload(map_y)
+        return cv2.cuda.remap(gpu_src, gpu_x, gpu_y, cv2.INTER_LINEAR).download()
+    except cv2.error:
+        return cv2.remap(img_array, map_x, map_y, cv2.INTER_LINEAR)
+
+
+def _draw_wrinkle(layer: np.ndarray, center: int, amplitude: float,
+                  frequency: float, strength: float) -> None:
+    """Darken one crease running along the columns of layer (in place)."""
+    rows, cols = layer.shape
+    xs = np.arange(cols)
+
+    # Jittered crease position for every column
+    phases = np.random.uniform(0, 2 * np.pi, cols)
+    offsets = (amplitude * np.sin(frequency * xs + phases)).astype(np.int64)
+    positions = np.clip(center + offsets, 0, rows - 1)
+
+    # STRONG visible shadow
+    layer[positions, xs] *= (1.0 - strength)
+
+    # Wider smooth transition, skipping rows that fall off the page
+    spread = np.arange(-3, 4)
+    fades = (1.0 - strength * (1.0 - np.abs(spread) / 4.0) * 0.5).astype(np.float32)
+    band_rows = positions[None, :] + spread[:, None]
+    valid = (band_rows >= 0) & (band_rows < rows)
+    band_cols = np.broadcast_to(xs, band_rows.shape)
+    band_fades = np.broadcast_to(fades[:, None], band_rows.shape)
+    layer[band_rows[valid], band_cols[valid]] *= band_fades[valid]
+
+
 def apply_wrinkles(image: Image.Image, intensity: float) -> Image.Image:
     """Add realistic paper wrinkles/creases - paper gets folded and wrinkled."""
     if intensity < 0.01:
         return image
+    img_array = _to_float(image)
+    height, width = img_array.shape[:2]
 
-    width, height = image.size
-    img_array = np.array(image, dtype=np.float32)
+    # Apply wrinkle shading
+    img_array *= _wrinkle_mask(height, width, intensity)[:, :, None]
+    np.clip(img_array, 0, 255, out=img_array)
+
+    return _to_image(img_array)
 
+
+def _wrinkle_mask(height: int, width: int, intensity: float) -> np.ndarray:
+    """Single-channel brightness multiplier (<= 1) with the wrinkle creases."""
     # Create wrinkle overlay
     wrinkle_layer = np.ones((height, width), dtype=np.float32)
 
@@ -286,56 +425,47 @@ def apply_wrinkles(image: Image.Image, intensity: float) -> Image.Image:
             amplitude = random.uniform(2.0, 6.0) * intensity
             frequency = random.uniform(0.003, 0.015)
             wrinkle_strength = intensity * random.uniform(0.15, 0.3)  # MUCH stronger
-
-            for x in range(width):
-                offset = int(amplitude * np.sin(frequency * x + random.uniform(0, 2 * np.pi)))
-                y_pos = min(max(y + offset, 0), height - 1)
-                # STRONG visible shadow
-                wrinkle_layer[y_pos, x] *= (1.0 - wrinkle_strength)
-                # Wider smooth transition
-                for dy in range(-3, 4):
-                    if 0 <= y_pos + dy < height:
-                        fade = 1.0 - abs(dy) / 4.0
-                        wrinkle_layer[y_pos + dy, x] *= (1.0 - wrinkle_strength * fade * 0.5)
+            _draw_wrinkle(wrinkle_layer, y, amplitude, frequency, wrinkle_strength)
         else:
-            # Vertical wrinkle
+            # Vertical wrinkle - same crease drawn on the transposed view
             x = random.randint(int(width * 0.05), int(width * 0.95))
             amplitude = random.uniform(2.0, 6.0) * intensity
             frequency = random.uniform(0.003, 0.015)
             wrinkle_strength = intensity * random.uniform(0.15, 0.3)
-
-            for y in range(height):
-                offset = int(amplitude * np.sin(frequency * y + random.uniform(0, 2 * np.pi)))
-                x_pos = min(max(x + offset, 0), width - 1)
-                wrinkle_layer[y, x_pos] *= (1.0 - wrinkle_strength)
-                for dx in range(-3, 4):
-                    if 0 <= x_pos + dx < width:
-                        fade = 1.0 - abs(dx) / 4.0
-                        wrinkle_layer[y, x_pos + dx] *= (1.0 - wrinkle_strength * fade * 0.5)
+            _draw_wrinkle(wrinkle_layer.T, x, amplitude, frequency, wrinkle_strength)
 
     # Small blur to smooth slightly but keep visible
     if HAS_OPENCV:
         blur_size = 3
         wrinkle_layer = cv2.GaussianBlur(wrinkle_layer, (blur_size, blur_size), 0)
 
-    # Apply wrinkle shading
-    wrinkle_rgb = np.stack([wrinkle_layer] * 3, axis=2)
-    result = img_array * wrinkle_rgb
-    result = np.clip(result, 0, 255).astype(np.uint8)
+    return wrinkle_layer
+
 
-    return Image.fromarray(result)
+def _band_profile(size: int, strength: float) -> np.ndarray:
+    """Multiplier across a shadow band - darkest in the middle, fading to the edges."""
+    half = max(size // 2, 1)
+    fade = 1.0 - np.abs(np.arange(size) - half) / half
+    return (1.0 - strength * fade).astype(np.float32)
 
 
 def apply_shadows(image: Image.Image, intensity: float, tilt: float) -> Image.Image:
     """Add realistic edge vignetting - scanner light doesn't reach edges as well."""
     if intensity < 0.01:
         return image
-
-    width, height = image.size
-    img_array = np.array(image, dtype=np.float32)
-
-    # Create multiple random shadow bands
-    shadow = np.ones((height, width), dtype=np.float32)
+    img_array = _to_float(image)
+    height, width = img_array.shape[:2]
+    img_array *= _shadow_mask(height, width, intensity)[:, :, None]
+    np.clip(img_array, 0, 255, out=img_array)
+    return _to_image(img_array)
+
+
+def _shadow_mask(height: int, width: int, intensity: float) -> np.ndarray:
+    """Single-channel brightness multiplier (<= 1) with the shadow bands."""
+    # Create multiple random shadow bands - every band spans a full row or column,
+    # so the mask is the outer product of a row profile and a column profile
+    row_shadow = np.ones(height, dtype=np.float32)
+    col_shadow = np.ones(width, dtype=np.float32)
     min_bands = 1
     max_bands = 6
     num_bands = int(min_bands + intensity * (max_bands - min_bands))
@@ -347,26 +477,21 @@ def apply_shadows(image: Image.Image, intensity: float, tilt: float) -> Image.Im
             band_height = random.randint(int(height * 0.07), int(height * 0.18))
             band_y = random.randint(int(height * 0.15), int(height * 0.85) - band_height)
             band_strength = random.uniform(0.08, 0.22) * (0.7 + intensity * 0.6)
-            for y in range(band_y, band_y + band_height):
-                fade = 1.0 - abs(y - (band_y + band_height // 2)) / (band_height // 2)
-                shadow[y, :] *= (1.0 - band_strength * fade)
+            row_shadow[band_y:band_y + band_height] *= _band_profile(band_height, band_strength)
         else:
             band_width = random.randint(int(width * 0.07), int(width * 0.18))
             band_x = random.randint(int(width * 0.15), int(width * 0.85) - band_width)
             band_strength = random.uniform(0.08, 0.22) * (0.7 + intensity * 0.6)
-            for x in range(band_x, band_x + band_width):
-                fade = 1.0 - abs(x - (band_x + band_width // 2)) / (band_width // 2)
-                shadow[:, x] *= (1.0 - band_strength * fade)
+            col_shadow[band_x:band_x + band_width] *= _band_profile(band_width, band_strength)
     # Moderate blur for realism
     if HAS_OPENCV:
         blur_size = int(15 + intensity * 30)
         if blur_size % 2 == 0:
             blur_size += 1
-        shadow = cv2.GaussianBlur(shadow, (blur_size, blur_size), 0)
-    shadow_rgb = np.stack([shadow] * 3, axis=2)
-    result = img_array * shadow_rgb
-    result = np.clip(result, 0, 255).astype(np.uint8)
-    return Image.fromarray(result)
+        # Gaussian blur is separable, so blurring each profile equals blurring the full mask
+        row_shadow = cv2.GaussianBlur(row_shadow[:, None], (1, blur_size), 0).ravel()
+        col_shadow = cv2.GaussianBlur(col_shadow[None, :], (blur_size, 1), 0).ravel()
+    return row_shadow[:, None] * col_shadow[None, :]
 
 
 def apply_noise(image: Image.Image, intensity: float) -> Image.Image:
@@ -374,27 +499,43 @@ def apply_noise(image: Image.Image, intensity: float) -> Image.Image:
     if intensity < 0.01:
         return image
 
-    width, height = image.size
-    img_array = np.array(image, dtype=np.float32)
+    if HAS_OPENCV:
+        return Image.fromarray(_noise_uint8(np.asarray(image), intensity))
 
     # Generate visible Gaussian noise
-    noise = np.random.normal(0, intensity * 12, img_array.shape)
+    img_array = _to_float(image)
+    img_array += np.random.normal(0, intensity * 12, img_array.shape)
+    np.clip(img_array, 0, 255, out=img_array)
+
+    return _to_image(img_array)
 
-    # Add noise
-    noisy = img_array + noise
-    noisy = np.clip(noisy, 0, 255).astype(np.uint8)
 
-    return Image.fromarray(noisy)
+def _noise_uint8(img_array: np.ndarray, intensity: float) -> np.ndarray:
+    """Integer Gaussian noise added with saturating uint8 arithmetic - no float buffers (OpenCV only)."""
+    noise = np.empty(img_array.shape, dtype=np.int16)
+    sigma = intensity * 12
+    cv2.randn(noise, (0, 0, 0), (sigma, sigma, sigma))
+    return cv2.add(img_array, noise, dtype=cv2.CV_8U)
 
 
 def apply_paper_texture(image: Image.Image, intensity: float) -> Image.Image:
     """Add realistic paper grain - paper has visible texture, not smooth."""
     if intensity < 0.01:
         return image
+    img_array = _to_float(image)
+    height, width = img_array.shape[:2]
+    return _to_image(_add_grain(img_array, _grain_layer(height, width, intensity)))
+
+
+def _add_grain(img_array: np.ndarray, grain: np.ndarray) -> np.ndarray:
+    """Add a precomputed single-channel grain layer to a float32 buffer (in place)."""
+    img_array += grain[:, :, None]
+    np.clip(img_array, 0, 255, out=img_array)
+    return img_array
 
-    width, height = image.size
-    img_array = np.array(image, dtype=np.float32)
 
+def _grain_layer(height: int, width: int, intensity: float) -> np.ndarray:
+    """Single-channel additive paper grain, already scaled by intensity."""
     # Create visible paper grain
     grain_width = width // 2
     grain_height = height // 2
@@ -410,12 +551,25 @@ def apply_paper_texture(image: Image.Image, intensity: float) -> Image.Image:
     grain_img = grain_img.resize((width, height), Image.Resampling.BILINEAR)
     grain = np.array(grain_img, dtype=np.float32) - 128  # Center around 0
 
-    # Apply texture - VERY visible
-    grain_rgb = np.stack([grain] * 3, axis=2)
-    result = img_array + grain_rgb * intensity * 1.5  # Much stronger application
-    result = np.clip(result, 0, 255).astype(np.uint8)
+    # Texture is VERY visible
+    return grain * (intensity * 1.5)  # Much stronger application
+
+
+def _draw_outline(layer: np.ndarray, x0: int, y0: int, x1: int, y1: int, value: int) -> None:
+    """Set the 1px outline of the inclusive rectangle (x0, y0)-(x1, y1), clipped to layer."""
+    height, width = layer.shape[:2]
+    left, right = max(x0, 0), min(x1, width - 1)
+    top, bottom = max(y0, 0), min(y1, height - 1)
+    if left > right or top > bottom:
+        return
+    for y in (y0, y1):
+        if 0 <= y < height:
+            layer[y, left:right + 1] = value
+    for x in (x0, x1):
+        if 0 <= x < width:
+            layer[top:bottom + 1, x] = value
+
 
-    return Image.fromarray(result)
 def apply_page_edge(image: Image.Image, intensity: float, tilt: float) -> Image.Image:
     """Add realistic scanner bed background with gradient - like real flatbed scanner with non-uniform border."""
     if intensity < 0.01:
@@ -447,8 +601,8 @@ def apply_page_edge(image: Image.Image, intensity: float, tilt: float) -> Image.
     # Create REALISTIC scanner bed - multi-tone gradient like real scanner glass
     bg_array = np.zeros((new_height, new_width, 3), dtype=np.float32)
 
-    # Create coordinate grids
-    y_grid, x_grid = np.mgrid[0:new_height, 0:new_width]
+    # Create coordinate grids (broadcastable row/column vectors)
+    y_grid, x_grid = np.ogrid[0:new_height, 0:new_width]
 
     # REALISTIC scanner bed - medium-light gray with SUBTLE gradient
     # Real scanner beds are NOT dark - they're light/medium gray!
@@ -464,22 +618,22 @@ def apply_page_edge(image: Image.Image, intensity: float, tilt: float) -> Image.
     page_center_x = border_left + width / 2
     page_center_y = border_top + height / 2
 
-    # Create mask for border-only gradient
-    for y in range(new_height):
-        for x in range(new_width):
-            # Only apply gradient in the BORDER areas, not the whole image
-            in_border = (x < border_left or x >= border_left + width or
-                        y < border_top or y >= border_top + height)
+    # Only apply gradient in the BORDER areas, not the whole image
+    in_border = ((x_grid < border_left) | (x_grid >= border_left + width) |
+                 (y_grid < border_top) | (y_grid >= border_top + height))
 
-            if in_border:
-                # Calculate distance from nearest page edge
-                dist_x = min(abs(x - border_left), abs(x - (border_left + width)))
-                dist_y = min(abs(y - border_top), abs(y - (border_top + height)))
-                edge_dist = min(dist_x, dist_y)
+    # Calculate distance from nearest page edge
+    dist_x = np.minimum(np.abs(x_grid - border_left), np.abs(x_grid - (border_left + width)))
+    dist_y = np.minimum(np.abs(y_grid - border_top), np.abs(y_grid - (border_top + height)))
+    edge_dist = np.minimum(dist_x, dist_y)
 
-                # VERY SUBTLE darkening as you go further from page (0-15 gray levels max)
-                darkening = int(edge_dist * 0.15)
-                bg_array[y, x] = np.clip(bg_array[y, x] - darkening, 100, 255)
+    # VERY SUBTLE darkening as you go further from page (0-15 gray levels max)
+    darkening = np.floor(edge_dist * 0.15).astype(np.float32)
+    bg_array = np.where(
+        in_border[:, :, None],
+        np.clip(bg_array - darkening[:, :, None], 100, 255),
+        bg_array
+    )
 
     # Add fine noise/texture (dust, scanner bed imperfections)
     noise = np.random.normal(0, 4, (new_height, new_width, 3))  # Subtle noise
@@ -487,35 +641,39 @@ def apply_page_edge(image: Image.Image, intensity: float, tilt: float) -> Image.
 
     # Add a few subtle vertical streaks (scanner glass very minor scratches)
     num_streaks = random.randint(3, 8)
-    for _ in range(num_streaks):
-        streak_x = random.randint(0, new_width - 1)
-        streak_variation = random.uniform(2, 6)  # Very subtle
-        streak_width = 1
-        bg_array[:, max(0, streak_x - streak_width):min(new_width, streak_x + streak_width)] -= streak_variation
+    streak_xs = np.random.randint(0, new_width, num_streaks)
+    streak_variations = np.random.uniform(2, 6, num_streaks)  # Very subtle
+    streak_cols = np.concatenate([streak_xs - 1, streak_xs])  # 2px wide
+    keep = streak_cols >= 0
+    column_darkening = np.zeros(new_width, dtype=np.float32)
+    np.add.at(column_darkening, streak_cols[keep], np.tile(streak_variations, 2)[keep])
+    bg_array -= column_darkening[None, :, None]
 
     # Add very few small dust spots
     num_spots = random.randint(10, 25)
-    for _ in range(num_spots):
-        spot_x = random.randint(0, new_width - 1)
-        spot_y = random.randint(0, new_height - 1)
-        spot_size = random.randint(1, 2)
-        spot_change = random.uniform(-8, -3)  # Subtle spots
-        y1, y2 = max(0, spot_y - spot_size), min(new_height, spot_y + spot_size)
-        x1, x2 = max(0, spot_x - spot_size), min(new_width, spot_x + spot_size)
-        bg_array[y1:y2, x1:x2] = np.clip(bg_array[y1:y2, x1:x2] + spot_change, 100, 255)
+    spot_xs = np.random.randint(0, new_width, num_spots)
+    spot_ys = np.random.randint(0, new_height, num_spots)
+    spot_sizes = np.random.randint(1, 3, num_spots)
+    spot_changes = np.random.uniform(-8, -3, num_spots)  # Subtle spots
+
+    # Every spot covers [-size, size) around its center - expand to a 4x4 window and mask
+    window = np.arange(-2, 2)
+    dy, dx = window[:, None, None], window[None, :, None]
+    ys, xs = np.broadcast_arrays(spot_ys + dy, spot_xs + dx)
+    covered = ((dy >= -spot_sizes) & (dy < spot_sizes) & (dx >= -spot_sizes) & (dx < spot_sizes) &
+               (ys >= 0) & (ys < new_height) & (xs >= 0) & (xs < new_width))
+    spot_layer = np.zeros((new_height, new_width), dtype=np.float32)
+    np.add.at(spot_layer, (ys[covered], xs[covered]), np.broadcast_to(spot_changes, covered.shape)[covered])
+    bg_array += spot_layer[:, :, None]
 
     # Clip to valid range - keep it LIGHT
     bg_array = np.clip(bg_array, 100, 255).astype(np.uint8)
 
-    # Create PIL image from background
-    result = Image.fromarray(bg_array, mode='RGB')
-
     # Paste the document page (non-uniform position due to tilt)
-    result.paste(image, (border_left, border_top))
+    bg_array[border_top:border_top + height, border_left:border_left + width] = np.asarray(image)
 
     # Add subtle drop shadow around page (page is slightly above scanner bed)
-    shadow_overlay = Image.new('RGBA', (new_width, new_height), (0, 0, 0, 0))
-    draw = ImageDraw.Draw(shadow_overlay)
+    shadow_alpha = np.zeros((new_height, new_width), dtype=np.uint8)
 
     # Soft shadow parameters
     shadow_offset = 3
@@ -534,16 +692,19 @@ def apply_page_edge(image: Image.Image, intensity: float, tilt: float) -> Image.
     for i in range(10):
         alpha = int(30 * (10 - i) / 10)
         offset = i
-        draw.rectangle(
-            [shadow_rect[0] - offset, shadow_rect[1] - offset,
-             shadow_rect[2] + offset, shadow_rect[3] + offset],
-            outline=(0, 0, 0, alpha)
+        _draw_outline(
+            shadow_alpha,
+            shadow_rect[0] - offset, shadow_rect[1] - offset,
+            shadow_rect[2] + offset, shadow_rect[3] + offset,
+            alpha
         )
 
     # Blur the shadow for realism
-    shadow_overlay = shadow_overlay.filter(ImageFilter.GaussianBlur(radius=shadow_blur))
+    shadow_img = Image.fromarray(shadow_alpha).filter(ImageFilter.GaussianBlur(radius=shadow_blur))
 
-    # Composite shadow
-    result = Image.alpha_composite(result.convert('RGBA'), shadow_overlay).convert('RGB')
+    # Composite black shadow over the scan using its alpha
+    coverage = 1.0 - np.asarray(shadow_img, dtype=np.float32) / 255.0
+    result = bg_array * coverage[:, :, None] + 0.5
+    result = Image.fromarray(result.astype(np.uint8))
 
     return result
@@ -2,14 +2,127 @@
 PDF processing utilities for rendering and conversion.
 """
 import os
+import re
+import glob
+import multiprocessing
+import threading
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 from pathlib import Path
-from typing import List, Callable, Optional
+from typing import Dict, List, Set, Callable, Optional, Tuple
 import fitz  # PyMuPDF
+import numpy as np
 from PIL import Image
 import io
 
-from config import EffectConfig
-from effects import apply_scan_effects
+from config import EffectConfig, MAX_PREVIEW_DIMENSION, CONVERT_BATCH_PAGES
+from effects import apply_scan_effects_array, set_mask_workers, HAS_OPENCV
+
+if HAS_OPENCV:
+    import cv2
+
+# libjpeg-turbo encoder; needs both the PyTurboJPEG package and the native library
+try:
+    from turbojpeg import TurboJPEG, TJPF_RGB, TJSAMP_420
+    _TURBOJPEG = TurboJPEG()
+    HAS_TURBOJPEG = True
+except (ImportError, RuntimeError, OSError):
+    HAS_TURBOJPEG = False
+
+# Open documents kept around for repeated previews
+DOC_CACHE_SIZE = 4
+
+# MuPDF places JPEGs without a density tag at 96 DPI; pages keep that physical size
+_JPEG_POINTS_PER_PIXEL = 72 / 96
+
+# Page workers are shared by every conversion so concurrent PDFs can't oversubscribe the CPU
+_PAGE_POOL = None
+_PAGE_POOL_LOCK = threading.Lock()
+
+
+def _init_page_worker():
+    """Keep each worker process to about one core - the pool already runs one worker per core."""
+    if HAS_OPENCV:
+        cv2.setNumThreads(1)
+    set_mask_workers(1)
+
+
+def _page_pool() -> ProcessPoolExecutor:
+    """Return the shared page-worker pool, starting it on first use."""
+    global _PAGE_POOL
+    with _PAGE_POOL_LOCK:
+        if _PAGE_POOL is None:
+            # Spawned rather than forked: PyMuPDF isn't fork-safe and the parent runs Tk and worker threads
+            _PAGE_POOL = ProcessPoolExecutor(
+                max_workers=os.cpu_count() or 1,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_page_worker
+            )
+        return _PAGE_POOL
+
+
+def shutdown_pool():
+    """Stop the shared page workers without waiting, dropping any pages still queued."""
+    global _PAGE_POOL
+    with _PAGE_POOL_LOCK:
+        if _PAGE_POOL is not None:
+            _PAGE_POOL.shutdown(wait=False, cancel_futures=True)
+            _PAGE_POOL = None
+
+
+def _render_and_encode(pdf_path: str, page_num: int, config: EffectConfig) -> Tuple[bytes, Tuple[int, int], int]:
+    """
+    Render one page with scan effects and encode it as JPEG (runs in a worker process).
+
+    Returns:
+        JPEG bytes, the processed image size, and the longest side of the rendered pixmap
+    """
+    doc = fitz.open(pdf_path)
+    try:
+        page = doc[page_num]
+
+        # Render page straight at the target DPI
+        pix = page.get_pixmap(dpi=round(config.dpi), alpha=False)
+
+        # View the raw pixmap samples as an array - no PNG or PIL round trip
+        page_array = np.frombuffer(pix.samples, dtype=np.uint8).reshape(pix.height, pix.width, 3)
+        longest_side = max(pix.width, pix.height)
+        pix = None  # samples is a copy; free MuPDF's buffer before the effects run
+    finally:
+        doc.close()
+
+    # Apply scan effects
+    processed = apply_scan_effects_array(page_array, config)
+    del page_array
+    size = (processed.shape[1], processed.shape[0])
+
+    # Convert back to bytes, using JPEG quality from config
+    if HAS_TURBOJPEG:
+        jpeg_bytes = _TURBOJPEG.encode(
+            processed,
+            quality=int(config.jpg_quality),
+            pixel_format=TJPF_RGB,
+            jpeg_subsample=TJSAMP_420
+        )
+    elif HAS_OPENCV:
+        # Encodes the array directly; same 4:2:0 libjpeg output as Pillow, without the Image wrapper
+        _, encoded = cv2.imencode(
+            '.jpg',
+            cv2.cvtColor(processed, cv2.COLOR_RGB2BGR),
+            [cv2.IMWRITE_JPEG_QUALITY, int(config.jpg_quality), cv2.IMWRITE_JPEG_OPTIMIZE, 1]
+        )
+        jpeg_bytes = encoded.tobytes()
+    else:
+        img_byte_arr = io.BytesIO()
+        Image.fromarray(processed).save(
+            img_byte_arr,
+            format='JPEG',
+            quality=int(config.jpg_quality),
+            optimize=True
+        )
+        jpeg_bytes = img_byte_arr.getvalue()
+    return jpeg_bytes, size, longest_side
 
 
 class PDFProcessor:
@@ -17,29 +130,104 @@ class PDFProcessor:
 
     def __init__(self):
         self.pdf_files: List[str] = []
+        self._version = 0  # Bumped on every queue change
+        # (path, mtime) -> page count
+        self._pagecount_cache: Dict[Tuple[str, float], int] = {}
+        # path -> (mtime, open document), least recently used first
+        self._doc_cache: "OrderedDict[str, Tuple[float, fitz.Document]]" = OrderedDict()
+        self._doc_lock = threading.Lock()
+        # Output paths claimed by conversions still in progress
+        self._reserved_outputs: Set[str] = set()
+        self._output_lock = threading.Lock()
 
     def add_pdf(self, filepath: str) -> bool:
         """Add a PDF to the processing queue."""
         if os.path.exists(filepath) and filepath.lower().endswith('.pdf'):
             if filepath not in self.pdf_files:
                 self.pdf_files.append(filepath)
+                self._version += 1
                 return True
         return False
 
+    def add_pdfs(self, filepaths: List[str]) -> int:
+        """Add several PDFs to the queue in one pass, skipping duplicates. Returns number added."""
+        queued = set(self.pdf_files)
+        new_files = [
+            path for path in dict.fromkeys(filepaths)
+            if path not in queued and path.lower().endswith('.pdf') and os.path.exists(path)
+        ]
+        if new_files:
+            self.pdf_files.extend(new_files)
+            self._version += 1
+        return len(new_files)
+
     def remove_pdf(self, filepath: str):
         """Remove a PDF from the queue."""
         if filepath in self.pdf_files:
             self.pdf_files.remove(filepath)
+            self._version += 1
+        for key in [key for key in self._pagecount_cache if key[0] == filepath]:
+            del self._pagecount_cache[key]
+        with self._doc_lock:
+            cached = self._doc_cache.pop(filepath, None)
+            if cached:
+                cached[1].close()
 
     def clear_queue(self):
         """Clear all PDFs from queue."""
         self.pdf_files.clear()
+        self._version += 1
+        self._pagecount_cache.clear()
+        self.close_all()
+
+    def close_all(self):
+        """Close every cached document."""
+        with self._doc_lock:
+            for _, doc in self._doc_cache.values():
+                doc.close()
+            self._doc_cache.clear()
+
+    def _get_doc(self, pdf_path: str) -> Tuple[fitz.Document, bool]:
+        """
+        Return an open document and whether it is cached (caller holds _doc_lock).
+
+        Documents are opened from an in-memory copy, so no file handle is held and queued PDFs
+        can still be renamed or deleted on Windows. Only queued files are cached; the caller
+        closes an uncached document when done.
+        """
+        mtime = os.path.getmtime(pdf_path)
+        cached = self._doc_cache.get(pdf_path)
+        if cached and cached[0] == mtime:
+            self._doc_cache.move_to_end(pdf_path)
+            return cached[1], True
+        if cached:
+            del self._doc_cache[pdf_path]
+            cached[1].close()
+
+        doc = fitz.open(stream=Path(pdf_path).read_bytes(), filetype="pdf")
+        if pdf_path not in self.pdf_files:
+            return doc, False
+        self._doc_cache[pdf_path] = (mtime, doc)
+        self._doc_cache.move_to_end(pdf_path)
+        while len(self._doc_cache) > DOC_CACHE_SIZE:
+            _, (_, evicted) = self._doc_cache.popitem(last=False)
+            evicted.close()
+        return doc, True
 
     def get_queue(self) -> List[str]:
         """Get list of queued PDFs."""
         return self.pdf_files.copy()
 
-    def render_page(self, pdf_path: str, page_num: int, config: EffectConfig) -> Optional[Image.Image]:
+    def queue_version(self) -> int:
+        """Counter that changes whenever the queue does - lets callers skip redraws without copying the list."""
+        return self._version
+
+    def render_page(
+        self,
+        pdf_path: str,
+        page_num: int,
+        config: EffectConfig
+    ) -> Optional[Image.Image]:
         """
         Render a single page from PDF with effects applied.
 
@@ -52,28 +240,27 @@ class PDFProcessor:
             PIL Image or None if error
         """
         try:
-            doc = fitz.open(pdf_path)
-            if page_num >= len(doc):
-                doc.close()
-                return None
+            # Documents aren't thread-safe, so renders from the cache are serialized
+            with self._doc_lock:
+                doc, cached = self._get_doc(pdf_path)
+                try:
+                    if page_num >= len(doc):
+                        return None
 
-            page = doc[page_num]
+                    page = doc[page_num]
 
-            # Render at specified DPI
-            zoom = config.dpi / 72.0
-            mat = fitz.Matrix(zoom, zoom)
-            pix = page.get_pixmap(matrix=mat)
+                    # Render at the output DPI so effect strengths match the converted pages
+                    pix = page.get_pixmap(dpi=round(config.dpi), alpha=False)
 
-            # Convert to PIL Image
-            img_data = pix.tobytes("png")
-            image = Image.open(io.BytesIO(img_data))
-
-            doc.close()
+                    # View the raw pixmap samples as an array - no PNG round trip
+                    page_array = np.frombuffer(pix.samples, dtype=np.uint8).reshape(pix.height, pix.width, 3)
+                    pix = None
+                finally:
+                    if not cached:
+                        doc.close()
 
             # Apply scan effects
-            processed_image = apply_scan_effects(image, config)
-
-            return processed_image
+            return Image.fromarray(apply_scan_effects_array(page_array, config))
 
         except Exception as e:
             print(f"Error rendering page: {e}")
@@ -98,6 +285,10 @@ class PDFProcessor:
         Returns:
             True if successful
         """
+        output_path = None
+        output_doc = None
+        completed = False
+        futures = pending = []
         try:
             # Open input PDF
             doc = fitz.open(pdf_path)
@@ -114,58 +305,63 @@ class PDFProcessor:
             # Create output PDF
             output_doc = fitz.open()
 
-            # Process each page
-            for page_num in range(total_pages):
-                if progress_callback:
-                    progress_callback(
-                        page_num + 1,
-                        total_pages,
-                        f"Processing page {page_num + 1}/{total_pages}..."
-                    )
-
-                page = doc[page_num]
-
-                # Render page
-                zoom = config.dpi / 72.0
-                mat = fitz.Matrix(zoom, zoom)
-                pix = page.get_pixmap(matrix=mat)
-
-                # Convert to PIL Image
-                img_data = pix.tobytes("png")
-                image = Image.open(io.BytesIO(img_data))
-
-                # Apply scan effects
-                processed_image = apply_scan_effects(image, config)
-
-                # Convert back to bytes, using JPEG quality from config
-                img_byte_arr = io.BytesIO()
-                processed_image.save(
-                    img_byte_arr,
-                    format='JPEG',
-                    quality=int(config.jpg_quality),
-                    optimize=True
-                )
-                img_byte_arr.seek(0)
-
-                # Create new page and insert image
-                img_doc = fitz.open("jpeg", img_byte_arr.read())
-                rect = img_doc[0].rect
-                pdf_page = output_doc.new_page(width=rect.width, height=rect.height)
-                pdf_page.insert_image(rect, stream=img_byte_arr.getvalue())
-                img_doc.close()
-
             # Set metadata
             if config.blank_metadata:
                 output_doc.set_metadata({})
             else:
                 # Copy original metadata
                 output_doc.set_metadata(doc.metadata)
-
-            # Save output
-            output_doc.save(output_path, garbage=4, deflate=True)
-            output_doc.close()
             doc.close()
 
+            # Render, process and encode pages in worker processes; results arrive in page order
+            render = partial(_render_and_encode, pdf_path, config=config)
+            pool = _page_pool()
+
+            batches = [
+                range(start, min(start + CONVERT_BATCH_PAGES, total_pages))
+                for start in range(0, total_pages, CONVERT_BATCH_PAGES)
+            ]
+            pending = [pool.submit(render, page_num) for page_num in batches[0]]
+
+            for batch_index, batch in enumerate(batches):
+                # Queue the next batch first so workers keep rendering while this one is written
+                futures = pending
+                pending = []
+                if batch_index + 1 < len(batches):
+                    pending = [pool.submit(render, page_num) for page_num in batches[batch_index + 1]]
+
+                for page_num, future in zip(batch, futures):
+                    jpeg_bytes, (width, height), longest_side = future.result()
+                    if progress_callback:
+                        progress_callback(
+                            page_num + 1,
+                            total_pages,
+                            f"Processed page {page_num + 1}/{total_pages}"
+                        )
+
+                    # Create new page and insert image
+                    rect = fitz.Rect(0, 0, width, height) * _JPEG_POINTS_PER_PIXEL
+
+                    # Oversized pages come back at the effects' working size - keep their physical size
+                    if longest_side > MAX_PREVIEW_DIMENSION:
+                        rect = rect * (longest_side / MAX_PREVIEW_DIMENSION)
+                    pdf_page = output_doc.new_page(width=rect.width, height=rect.height)
+                    pdf_page.insert_image(rect, stream=jpeg_bytes)
+
+                # Flush the batch to disk so at most one batch of pages is held in memory
+                if batch_index == 0:
+                    output_doc.save(output_path, garbage=4, deflate=True)
+                else:
+                    output_doc.saveIncr()
+                output_doc.close()
+                output_doc = None
+                if batch.stop < total_pages:
+                    output_doc = fitz.open(output_path)
+
+            # Incremental saves skip garbage collection and compression - rewrite once in full
+            if len(batches) > 1:
+                self._compact_pdf(output_path)
+
             if progress_callback:
                 progress_callback(
                     total_pages,
@@ -173,6 +369,7 @@ class PDFProcessor:
                     f"Completed: {os.path.basename(output_path)}"
                 )
 
+            completed = True
             return True
 
         except Exception as e:
@@ -181,26 +378,70 @@ class PDFProcessor:
                 progress_callback(0, 0, f"Error: {str(e)}")
             return False
 
-    def _get_unique_output_path(self, output_dir: str, base_name: str) -> str:
-        """Generate unique output filename."""
-        output_name = f"{base_name}_scanned.pdf"
-        output_path = os.path.join(output_dir, output_name)
-
-        # If file exists, add number
-        counter = 2
-        while os.path.exists(output_path):
-            output_name = f"{base_name}_scanned{counter}.pdf"
-            output_path = os.path.join(output_dir, output_name)
-            counter += 1
+        finally:
+            # A failed page leaves later pages queued in the shared pool - don't let them hold up other PDFs
+            for future in futures + pending:
+                future.cancel()
+            if output_doc is not None:
+                output_doc.close()
+            if output_path:
+                # Don't leave a partially written PDF behind
+                if not completed:
+                    for path in (output_path, output_path + ".tmp"):
+                        if os.path.exists(path):
+                            try:
+                                os.remove(path)
+                            except OSError:
+                                pass
+                self._release_output_path(output_path)
+
+    @staticmethod
+    def _compact_pdf(output_path: str):
+        """Rewrite a PDF with full garbage collection and deflate, replacing it in place."""
+        temp_path = output_path + ".tmp"
+        doc = fitz.open(output_path)
+        try:
+            doc.save(temp_path, garbage=4, deflate=True)
+        finally:
+            doc.close()
+        os.replace(temp_path, output_path)
 
-        return output_path
+    def _get_unique_output_path(self, output_dir: str, base_name: str) -> str:
+        """Generate unique output filename and reserve it until the conversion finishes."""
+        # Normalize so reservations match however the directory was spelled ("out", "out/", "./out")
+        output_dir = os.path.normpath(os.path.abspath(output_dir))
+        with self._output_lock:
+            output_path = os.path.join(output_dir, f"{base_name}_scanned.pdf")
+            if not os.path.exists(output_path) and output_path not in self._reserved_outputs:
+                self._reserved_outputs.add(output_path)
+                return output_path
+
+            # Taken - number one past the highest existing or reserved copy (the unnumbered file counts as 1)
+            pattern = re.compile(rf"{re.escape(base_name)}_scanned(\d*)\.pdf")
+            existing = glob.glob(os.path.join(glob.escape(output_dir), f"{glob.escape(base_name)}_scanned*.pdf"))
+            counters = [1]
+            for path in existing + [p for p in self._reserved_outputs if os.path.dirname(p) == output_dir]:
+                match = pattern.fullmatch(os.path.basename(path))
+                if match and match.group(1):
+                    counters.append(int(match.group(1)))
+
+            output_path = os.path.join(output_dir, f"{base_name}_scanned{max(counters) + 1}.pdf")
+            self._reserved_outputs.add(output_path)
+            return output_path
+
+    def _release_output_path(self, output_path: str):
+        """Drop a reservation once the file is on disk (or was abandoned)."""
+        with self._output_lock:
+            self._reserved_outputs.discard(output_path)
 
     def get_page_count(self, pdf_path: str) -> int:
-        """Get number of pages in PDF."""
+        """Get number of pages in PDF (cached until the file changes)."""
         try:
-            doc = fitz.open(pdf_path)
-            count = len(doc)
-            doc.close()
-            return count
+            key = (pdf_path, os.path.getmtime(pdf_path))
+            if key not in self._pagecount_cache:
+                doc = fitz.open(pdf_path)
+                self._pagecount_cache[key] = len(doc)
+                doc.close()
+            return self._pagecount_cache[key]
         except:
             return 0
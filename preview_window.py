@@ -1,9 +1,19 @@
 """
 Preview window with zoom, pan, and navigation controls.
 """
+from concurrent.futures import ThreadPoolExecutor
+import tkinter as tk
 import customtkinter as ctk
+import numpy as np
 from PIL import Image, ImageTk
 from config import COLOR_BG, COLOR_CARD, COLOR_BUTTON, COLOR_BUTTON_HOVER
+from ui_components import get_font
+
+try:
+    import cv2
+    HAS_OPENCV = True
+except ImportError:
+    HAS_OPENCV = False
 
 
 class PreviewWindow(ctk.CTkToplevel):
@@ -29,6 +39,16 @@ class PreviewWindow(ctk.CTkToplevel):
         self.drag_start_x = 0
         self.drag_start_y = 0
 
+        # Zoom resizes run on a worker thread, debounced so fast wheel spins coalesce
+        self._resize_job = None
+        self._resize_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="scanify-preview")
+        self.photo = None
+        self._img_id = None
+
+        # Half-size mipmaps of the original, built on demand by the resize worker
+        self._mips = [image]
+        self._mip_arrays = {}  # mip level -> numpy copy for cv2.resize
+
         self._build_ui()
         self._display_image()
 
@@ -51,7 +71,7 @@ class PreviewWindow(ctk.CTkToplevel):
         ctk.CTkLabel(
             zoom_frame,
             text="🔍 Zoom:",
-            font=ctk.CTkFont(size=13)
+            font=get_font(13)
         ).pack(side="left", padx=(0, 8))
 
         ctk.CTkButton(
@@ -62,13 +82,13 @@ class PreviewWindow(ctk.CTkToplevel):
             command=lambda: self._zoom(-0.2),
             fg_color=COLOR_BUTTON,
             hover_color=COLOR_BUTTON_HOVER,
-            font=ctk.CTkFont(size=18, weight="bold")
+            font=get_font(18, "bold")
         ).pack(side="left", padx=2)
 
         self.zoom_label = ctk.CTkLabel(
             zoom_frame,
             text="100%",
-            font=ctk.CTkFont(size=13, weight="bold"),
+            font=get_font(13, "bold"),
             width=70
         )
         self.zoom_label.pack(side="left", padx=8)
@@ -81,7 +101,7 @@ class PreviewWindow(ctk.CTkToplevel):
             command=lambda: self._zoom(0.2),
             fg_color=COLOR_BUTTON,
             hover_color=COLOR_BUTTON_HOVER,
-            font=ctk.CTkFont(size=18, weight="bold")
+            font=get_font(18, "bold")
         ).pack(side="left", padx=2)
 
         ctk.CTkButton(
@@ -92,7 +112,7 @@ class PreviewWindow(ctk.CTkToplevel):
             command=self._fit_to_window,
             fg_color=COLOR_BUTTON,
             hover_color=COLOR_BUTTON_HOVER,
-            font=ctk.CTkFont(size=12)
+            font=get_font(12)
         ).pack(side="left", padx=(10, 0))
 
         ctk.CTkButton(
@@ -103,14 +123,14 @@ class PreviewWindow(ctk.CTkToplevel):
             command=self._reset_zoom,
             fg_color=COLOR_BUTTON,
             hover_color=COLOR_BUTTON_HOVER,
-            font=ctk.CTkFont(size=12)
+            font=get_font(12)
         ).pack(side="left", padx=5)
 
         # Info label
         ctk.CTkLabel(
             toolbar,
             text="💡 Use mouse wheel to zoom • Click and drag to pan",
-            font=ctk.CTkFont(size=11),
+            font=get_font(11),
             text_color="gray"
         ).pack(side="right", padx=10)
 
@@ -127,20 +147,79 @@ class PreviewWindow(ctk.CTkToplevel):
         self.canvas.pack(fill="both", expand=True)
 
     def _display_image(self):
-        """Display the image at current zoom level."""
-        # Calculate new size
-        new_width = int(self.original_image.width * self.zoom_level)
-        new_height = int(self.original_image.height * self.zoom_level)
-
-        # Resize image
-        if self.zoom_level != 1.0:
-            resample = Image.Resampling.LANCZOS if self.zoom_level < 1.0 else Image.Resampling.BICUBIC
-            display_img = self.original_image.resize((new_width, new_height), resample)
-        else:
-            display_img = self.original_image
+        """Display the image at current zoom level (resized in the background after a short debounce)."""
+        # Update zoom label right away; the bitmap follows once resized
+        self.zoom_label.configure(text=f"{int(self.zoom_level * 100)}%")
+
+        if self._resize_job:
+            self.after_cancel(self._resize_job)
+        self._resize_job = self.after(15, self._start_resize)
+
+    def _start_resize(self):
+        """Submit a resize of the original image for the current zoom level."""
+        self._resize_job = None
+        zoom = self.zoom_level
+        future = self._resize_pool.submit(self._resize_image, zoom)
+        future.add_done_callback(lambda f: self._on_resize_done(f, zoom))
+
+    def _on_resize_done(self, future, zoom: float):
+        """Hand a finished resize to the Tk thread (runs on the worker thread)."""
+        # Cancelled or failed when the window closed - there is nothing to show
+        if future.cancelled() or future.exception() is not None:
+            return
+        display_img = future.result()
+        try:
+            if self.winfo_exists():
+                self.after(0, lambda: self._show_resized(display_img, zoom))
+        except (tk.TclError, RuntimeError):
+            pass  # Window or main loop already gone
+
+    def _resize_image(self, zoom: float) -> Image.Image:
+        """Resize the original image for a zoom level (runs on the worker thread)."""
+        if zoom == 1.0:
+            return self.original_image
+
+        new_width = int(self.original_image.width * zoom)
+        new_height = int(self.original_image.height * zoom)
+        level = self._mip_level(new_width)
+
+        if HAS_OPENCV:
+            # SIMD resampling; INTER_AREA is OpenCV's recommended filter for shrinking
+            if level not in self._mip_arrays:
+                self._mip_arrays[level] = np.asarray(self._mips[level])
+            interpolation = cv2.INTER_AREA if zoom < 1.0 else cv2.INTER_CUBIC
+            resized = cv2.resize(self._mip_arrays[level], (new_width, new_height), interpolation=interpolation)
+            return Image.fromarray(resized)
+
+        resample = Image.Resampling.LANCZOS if zoom < 1.0 else Image.Resampling.BICUBIC
+        return self._mips[level].resize((new_width, new_height), resample)
+
+    def _mip_level(self, width: int) -> int:
+        """Return the level of the smallest mipmap at least `width` pixels wide, reducing further as needed."""
+        level = 0
+        while True:
+            if level + 1 == len(self._mips):
+                mip = self._mips[level]
+                if mip.width // 2 < max(width, 256) or mip.height // 2 < 256:
+                    return level
+                self._mips.append(mip.reduce(2))
+            if self._mips[level + 1].width < width:
+                return level
+            level += 1
+
+    def _show_resized(self, display_img: Image.Image, zoom: float):
+        """Swap in a resized bitmap unless the zoom level has moved on since it was requested."""
+        if zoom != self.zoom_level or not self.winfo_exists():
+            return
 
         # Convert to PhotoImage
         self.photo = ImageTk.PhotoImage(display_img)
+        self._draw_image()
+
+    def _draw_image(self):
+        """Draw the current bitmap centered with the pan offset."""
+        if self.photo is None:
+            return
 
         # Clear canvas and display
         self.canvas.delete("all")
@@ -149,13 +228,19 @@ class PreviewWindow(ctk.CTkToplevel):
         canvas_width = self.canvas.winfo_width()
         canvas_height = self.canvas.winfo_height()
 
-        x = (canvas_width - new_width) // 2 + self.pan_x
-        y = (canvas_height - new_height) // 2 + self.pan_y
+        x = (canvas_width - self.photo.width()) // 2 + self.pan_x
+        y = (canvas_height - self.photo.height()) // 2 + self.pan_y
 
-        self.canvas.create_image(x, y, anchor="nw", image=self.photo)
+        self._img_id = self.canvas.create_image(x, y, anchor="nw", image=self.photo)
 
-        # Update zoom label
-        self.zoom_label.configure(text=f"{int(self.zoom_level * 100)}%")
+    def destroy(self):
+        """Stop the resize worker along with the window."""
+        # A pending debounce would otherwise submit to the pool after it is shut down
+        if self._resize_job:
+            self.after_cancel(self._resize_job)
+            self._resize_job = None
+        self._resize_pool.shutdown(wait=False, cancel_futures=True)
+        super().destroy()
 
     def _zoom(self, delta: float):
         """Zoom in or out."""
@@ -188,7 +273,9 @@ class PreviewWindow(ctk.CTkToplevel):
         self.drag_start_x = event.x
         self.drag_start_y = event.y
 
-        self._display_image()
+        # Zoom is unchanged, so just shift the existing canvas item
+        if self._img_id is not None:
+            self.canvas.move(self._img_id, dx, dy)
 
     def _reset_zoom(self):
         """Reset to 100% zoom."""
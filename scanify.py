@@ -6,24 +6,29 @@ import customtkinter as ctk
 from tkinter import filedialog, messagebox
 import os
 import threading
+import multiprocessing
+import queue
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from PIL import Image, ImageTk
+from PIL import Image
 import tkinterdnd2 as tkdnd
 import sys
 import webbrowser
 import urllib.request
 import json
+import time
 from datetime import datetime
+from functools import lru_cache, partial
 
 from config import (
     EffectConfig, WINDOW_WIDTH, WINDOW_HEIGHT, CARD_PADDING, SECTION_SPACING,
     SLIDER_RANGES, QUEUE_HEIGHT, PREVIEW_HEIGHT, ACTIVITY_HEIGHT, BUTTON_HEIGHT,
     COLOR_BG, COLOR_BUTTON, COLOR_BUTTON_HOVER, COLOR_BUTTON_SECONDARY,
-    COLOR_BUTTON_SUCCESS, COLOR_TEXT, COLOR_TEXT_SECONDARY, COLOR_CARD, TOP_BAR_HEIGHT
+    COLOR_BUTTON_SUCCESS, COLOR_TEXT, COLOR_TEXT_SECONDARY, COLOR_CARD, TOP_BAR_HEIGHT,
+    MAX_CONVERT_WORKERS
 )
-from ui_components import Card, SliderCard, FileQueueList, ActivityLog
-from pdf_processor import PDFProcessor
-from preview_window import PreviewWindow
+from ui_components import Card, SliderCard, FileQueueList, ActivityLog, get_font
+from pdf_processor import PDFProcessor, shutdown_pool
 
 # Version info
 VERSION = "2.0.0"
@@ -31,6 +36,19 @@ GITHUB_REPO = "MrAayZee/Scanify"
 # Use raw GitHub URL to version.json (works with private repos if you make the file public)
 VERSION_CHECK_URL = f"https://raw.githubusercontent.com/{GITHUB_REPO}/main/version.json"
 DOWNLOAD_URL = f"https://github.com/{GITHUB_REPO}/releases/latest"
+# Startup update checks reuse the last fetched version.json for a day
+UPDATE_CACHE_FILE = Path.home() / ".scanify" / "update_cache.json"
+UPDATE_CACHE_TTL = 24 * 60 * 60
+UPDATE_CHECK_TIMEOUT = 3  # seconds
+
+
+@lru_cache(maxsize=32)
+def _parse_version(version: str) -> tuple:
+    """Parse a dotted version string into an int tuple, dropping trailing zeros so 2.0 == 2.0.0."""
+    parts = [int(x) for x in version.split('.')]
+    while parts and parts[-1] == 0:
+        parts.pop()
+    return tuple(parts)
 
 
 class ScanifyApp(ctk.CTk, tkdnd.TkinterDnD.DnDWrapper):
@@ -97,6 +115,12 @@ class ScanifyApp(ctk.CTk, tkdnd.TkinterDnD.DnDWrapper):
         self.output_dir = ctk.StringVar(value="")
         self.preview_image = None
         self.is_processing = False
+        self._progress_queue = queue.Queue()
+        self._convert_pool = None
+        self._preview_debounce_id = None
+        self._last_preview_source = None
+        self._last_preview_size = None
+        self._shown_queue_version = None
 
         # Build UI
         self._build_ui()
@@ -133,9 +157,9 @@ class ScanifyApp(ctk.CTk, tkdnd.TkinterDnD.DnDWrapper):
         middle_frame.grid_columnconfigure(1, weight=3, minsize=650)
         middle_frame.grid_rowconfigure(0, weight=1)
 
-        # Build sections
+        # Build sections - the slider panel is built once the window has been drawn
         self._build_left_panel(left_panel)
-        self._build_right_sliders(right_panel)
+        self.after_idle(lambda: self._build_right_sliders(right_panel))
 
     def _build_top_bar(self, parent):
         """Build compact top bar with all file/output/action controls."""
@@ -152,27 +176,27 @@ class ScanifyApp(ctk.CTk, tkdnd.TkinterDnD.DnDWrapper):
         ctk.CTkLabel(
             row1,
             text="📁 Files:",
-            font=ctk.CTkFont(size=13, weight="bold")
+            font=get_font(13, "bold")
         ).pack(side="left", padx=(0, 10))
 
         self.browse_btn = ctk.CTkButton(
             row1, text="Browse", command=self._browse_files,
             width=90, height=BUTTON_HEIGHT, fg_color=COLOR_BUTTON,
-            hover_color=COLOR_BUTTON_HOVER, font=ctk.CTkFont(size=12), corner_radius=0
+            hover_color=COLOR_BUTTON_HOVER, font=get_font(12), corner_radius=0
         )
         self.browse_btn.pack(side="left", padx=(0, 5))
 
         self.remove_btn = ctk.CTkButton(
             row1, text="Remove", command=self._remove_selected,
             width=80, height=BUTTON_HEIGHT, fg_color=COLOR_BUTTON_SECONDARY,
-            hover_color="#5a6268", font=ctk.CTkFont(size=12), corner_radius=0
+            hover_color="#5a6268", font=get_font(12), corner_radius=0
         )
         self.remove_btn.pack(side="left", padx=(0, 5))
 
         self.clear_btn = ctk.CTkButton(
             row1, text="Clear", command=self._clear_files,
             width=70, height=BUTTON_HEIGHT, fg_color=COLOR_BUTTON_SECONDARY,
-            hover_color="#5a6268", font=ctk.CTkFont(size=12), corner_radius=0
+            hover_color="#5a6268", font=get_font(12), corner_radius=0
         )
         self.clear_btn.pack(side="left", padx=(0, 20))
 
@@ -180,7 +204,7 @@ class ScanifyApp(ctk.CTk, tkdnd.TkinterDnD.DnDWrapper):
         ctk.CTkLabel(
             row1,
             text="💡 Drag & drop PDFs anywhere",
-            font=ctk.CTkFont(size=11),
+            font=get_font(11),
             text_color=COLOR_TEXT_SECONDARY
         ).pack(side="left")
 
@@ -188,14 +212,14 @@ class ScanifyApp(ctk.CTk, tkdnd.TkinterDnD.DnDWrapper):
         self.about_btn = ctk.CTkButton(
             row1, text="ℹ️ About", command=self._show_about,
             width=90, height=BUTTON_HEIGHT, fg_color=COLOR_BUTTON_SECONDARY,
-            hover_color="#5a6268", font=ctk.CTkFont(size=12), corner_radius=0
+            hover_color="#5a6268", font=get_font(12), corner_radius=0
         )
         self.about_btn.pack(side="right", padx=(5, 0))
 
         self.update_btn = ctk.CTkButton(
             row1, text="🔄 Check Updates", command=self._check_updates_manual,
             width=130, height=BUTTON_HEIGHT, fg_color=COLOR_BUTTON_SECONDARY,
-            hover_color="#5a6268", font=ctk.CTkFont(size=12), corner_radius=0
+            hover_color="#5a6268", font=get_font(12), corner_radius=0
         )
         self.update_btn.pack(side="right")
 
@@ -211,27 +235,27 @@ class ScanifyApp(ctk.CTk, tkdnd.TkinterDnD.DnDWrapper):
         ctk.CTkLabel(
             row2,
             text="📂 Output:",
-            font=ctk.CTkFont(size=13, weight="bold")
+            font=get_font(13, "bold")
         ).pack(side="left", padx=(0, 10))
 
         self.auto_checkbox = ctk.CTkCheckBox(
             row2, text="Auto", variable=self.auto_output,
             command=self._toggle_auto_output,
-            font=ctk.CTkFont(size=11), width=60
+            font=get_font(11), width=60
         )
         self.auto_checkbox.pack(side="left", padx=(0, 5))
 
         self.output_entry = ctk.CTkEntry(
             row2, textvariable=self.output_dir,
             placeholder_text="Output directory...",
-            height=BUTTON_HEIGHT, font=ctk.CTkFont(size=11), width=250
+            height=BUTTON_HEIGHT, font=get_font(11), width=250
         )
         self.output_entry.pack(side="left", padx=(0, 5))
 
         self.browse_output_btn = ctk.CTkButton(
             row2, text="Browse", command=self._browse_output,
             width=80, height=BUTTON_HEIGHT, fg_color=COLOR_BUTTON,
-            hover_color=COLOR_BUTTON_HOVER, font=ctk.CTkFont(size=12), corner_radius=0
+            hover_color=COLOR_BUTTON_HOVER, font=get_font(12), corner_radius=0
         )
         self.browse_output_btn.pack(side="left", padx=(0, 20))
 
@@ -239,18 +263,18 @@ class ScanifyApp(ctk.CTk, tkdnd.TkinterDnD.DnDWrapper):
         ctk.CTkLabel(
             row2,
             text="⚙️ Mode:",
-            font=ctk.CTkFont(size=13, weight="bold")
+            font=get_font(13, "bold")
         ).pack(side="left", padx=(0, 10))
 
         self.bw_switch = ctk.CTkSwitch(
             row2, text="B&W", command=self._toggle_bw,
-            font=ctk.CTkFont(size=11), width=70
+            font=get_font(11), width=70
         )
         self.bw_switch.pack(side="left", padx=(0, 10))
 
         self.metadata_checkbox = ctk.CTkCheckBox(
             row2, text="Blank metadata", command=self._toggle_metadata,
-            font=ctk.CTkFont(size=11), width=120
+            font=get_font(11), width=120
         )
         self.metadata_checkbox.select()  # Checked by default
         self.metadata_checkbox.pack(side="left")
@@ -282,7 +306,7 @@ class ScanifyApp(ctk.CTk, tkdnd.TkinterDnD.DnDWrapper):
             height=BUTTON_HEIGHT + 4,
             fg_color=COLOR_BUTTON,
             hover_color=COLOR_BUTTON_HOVER,
-            font=ctk.CTkFont(size=13, weight="bold"),
+            font=get_font(13, "bold"),
             corner_radius=0
         )
         self.preview_btn.pack(fill="x", pady=(0, 8))
@@ -294,7 +318,7 @@ class ScanifyApp(ctk.CTk, tkdnd.TkinterDnD.DnDWrapper):
             height=BUTTON_HEIGHT + 8,
             fg_color=COLOR_BUTTON_SUCCESS,
             hover_color="#218838",
-            font=ctk.CTkFont(size=14, weight="bold"),
+            font=get_font(14, "bold"),
             corner_radius=0
         )
         self.convert_btn.pack(fill="x")
@@ -336,13 +360,6 @@ class ScanifyApp(ctk.CTk, tkdnd.TkinterDnD.DnDWrapper):
         sliders_container.grid_columnconfigure(1, weight=1)
 
         # Compact slider definitions
-        sliders_col1 = [
-            ("DPI", "dpi"),
-            ("Lighting", "lighting"),
-            ("Wrinkles", "wrinkles"),
-            ("Warp", "warp"),
-            ("Texture", "paper_texture"),
-        ]
         sliders_col1 = [
             ("DPI", "dpi"),
             ("Lighting", "lighting"),
@@ -360,38 +377,25 @@ class ScanifyApp(ctk.CTk, tkdnd.TkinterDnD.DnDWrapper):
             ("Edge", "page_edge"),
         ]
 
-        self.sliders = {}
-
-        # Build column 1
-        for i, (label, key) in enumerate(sliders_col1):
-            min_val, max_val, step = SLIDER_RANGES[key]
-            default_val = getattr(self.config, key)
+        slider_specs = (
+            [(col1_frame, i, label, key) for i, (label, key) in enumerate(sliders_col1)]
+            + [(col2_frame, i, label, key) for i, (label, key) in enumerate(sliders_col2)]
+        )
 
-            slider = SliderCard(
-                col1_frame,
-                label=label,
-                min_val=min_val,
-                max_val=max_val,
-                step=step,
-                default_val=default_val,
-                command=lambda v, k=key: self._update_config(k, v)
-            )
-            slider.grid(row=i, column=0, sticky="ew", pady=(0, SECTION_SPACING))
-            self.sliders[key] = slider
+        self.sliders = {}
 
-        # Build column 2
-        for i, (label, key) in enumerate(sliders_col2):
+        # Build both columns
+        for frame, i, label, key in slider_specs:
             min_val, max_val, step = SLIDER_RANGES[key]
-            default_val = getattr(self.config, key)
 
             slider = SliderCard(
-                col2_frame,
+                frame,
                 label=label,
                 min_val=min_val,
                 max_val=max_val,
                 step=step,
-                default_val=default_val,
-                command=lambda v, k=key: self._update_config(k, v)
+                default_val=getattr(self.config, key),
+                command=partial(self._update_config, key)
             )
             slider.grid(row=i, column=0, sticky="ew", pady=(0, SECTION_SPACING))
             self.sliders[key] = slider
@@ -419,7 +423,7 @@ class ScanifyApp(ctk.CTk, tkdnd.TkinterDnD.DnDWrapper):
             self.preview_frame,
             text="No preview\n\n👆 Click 'Preview First Page' button above",
             text_color=COLOR_TEXT_SECONDARY,
-            font=ctk.CTkFont(size=13),
+            font=get_font(13),
             cursor="hand2"
         )
         self.preview_label.pack(expand=True)
@@ -441,7 +445,6 @@ class ScanifyApp(ctk.CTk, tkdnd.TkinterDnD.DnDWrapper):
     def _toggle_metadata(self):
         """Toggle blank metadata."""
         self.config.blank_metadata = self.metadata_checkbox.get() == 1
-        print("this was ran")
 
     def _toggle_auto_output(self):
         """Toggle auto output directory."""
@@ -466,8 +469,7 @@ class ScanifyApp(ctk.CTk, tkdnd.TkinterDnD.DnDWrapper):
             filetypes=[("PDF files", "*.pdf"), ("All files", "*.*")]
         )
 
-        for file in files:
-            self.processor.add_pdf(file)
+        self.processor.add_pdfs(files)
 
         self._update_queue()
         self._update_auto_output()
@@ -486,20 +488,21 @@ class ScanifyApp(ctk.CTk, tkdnd.TkinterDnD.DnDWrapper):
         self.processor.clear_queue()
         self._update_queue()
         self.preview_label.configure(image=None, text="No preview")
+        self._last_preview_source = None
 
     def _update_queue(self):
         """Update queue display."""
+        version = self.processor.queue_version()
+        if version == self._shown_queue_version:
+            return
+        self._shown_queue_version = version
         self.queue_list.update_files(self.processor.pdf_files)
 
     def _on_drop(self, event):
         """Handle drag and drop."""
-        files = self.tk.splitlist(event.data)
-
-        for file in files:
-            # Clean up file path
-            file = file.strip('{}')
-            if file.lower().endswith('.pdf'):
-                self.processor.add_pdf(file)
+        # Clean up file paths; add_pdfs filters non-PDFs and duplicates
+        files = [file.strip('{}') for file in self.tk.splitlist(event.data)]
+        self.processor.add_pdfs(files)
 
         self._update_queue()
         self._update_auto_output()
@@ -527,14 +530,14 @@ class ScanifyApp(ctk.CTk, tkdnd.TkinterDnD.DnDWrapper):
         # Show progress in button
         self.preview_btn.configure(text="⏳ Generating preview...", state="disabled")
         self.activity_log.log("🔄 Generating preview...")
-        self.update()  # Force UI update
+        self.update_idletasks()  # Flush pending redraws
 
         def preview_thread():
             try:
                 pdf_path = self.processor.pdf_files[0]
                 pdf_name = os.path.basename(pdf_path)
 
-                # Render with effects
+                # Render once at output DPI - the thumbnail is downscaled from it and the zoom window reuses it
                 image = self.processor.render_page(pdf_path, 0, self.config)
 
                 if image:
@@ -583,7 +586,8 @@ class ScanifyApp(ctk.CTk, tkdnd.TkinterDnD.DnDWrapper):
             self.preview_window.focus()
             return
 
-        # Open new preview window
+        # Open new preview window (imported on first use to keep startup lean)
+        from preview_window import PreviewWindow
         self.preview_window = PreviewWindow(self, self.cached_preview_image, f"Preview - {self.cached_preview_name}")
         self.preview_window.lift()  # Bring to front
         self.preview_window.focus()  # Make active
@@ -591,7 +595,14 @@ class ScanifyApp(ctk.CTk, tkdnd.TkinterDnD.DnDWrapper):
         self.preview_window.after(100, lambda: self.preview_window.attributes('-topmost', False))  # Then allow normal behavior
 
     def _update_inline_preview(self, image: Image.Image):
+        """Schedule an inline preview thumbnail update, coalescing bursts of calls."""
+        if self._preview_debounce_id:
+            self.after_cancel(self._preview_debounce_id)
+        self._preview_debounce_id = self.after(50, lambda: self._render_inline_preview(image))
+
+    def _render_inline_preview(self, image: Image.Image):
         """Update the inline preview thumbnail."""
+        self._preview_debounce_id = None
         try:
             # Get preview frame dimensions
             frame_width = self.preview_frame.winfo_width()
@@ -603,6 +614,10 @@ class ScanifyApp(ctk.CTk, tkdnd.TkinterDnD.DnDWrapper):
             if frame_height < 100:
                 frame_height = 300
 
+            # Nothing to do if the same image is already shown at this size
+            if image is self._last_preview_source and self._last_preview_size == (frame_width, frame_height):
+                return
+
             # Calculate scaling to fit
             width_ratio = (frame_width - 40) / image.width
             height_ratio = (frame_height - 40) / image.height
@@ -611,23 +626,31 @@ class ScanifyApp(ctk.CTk, tkdnd.TkinterDnD.DnDWrapper):
             new_width = int(image.width * scale)
             new_height = int(image.height * scale)
 
-            # Resize for display
-            display_image = image.resize((new_width, new_height), Image.Resampling.LANCZOS)
+            # Resize for display; reducing_gap box-reduces large ratios before the LANCZOS pass
+            display_image = image.resize((new_width, new_height), Image.Resampling.LANCZOS, reducing_gap=2.0)
 
-            # Convert to CTkImage to avoid warning and support HighDPI
-            ctk_image = ctk.CTkImage(
-                light_image=display_image,
-                dark_image=display_image,
-                size=(new_width, new_height)
-            )
+            # Convert to CTkImage to avoid warning and support HighDPI; reuse it across updates
+            if self.preview_image is None:
+                self.preview_image = ctk.CTkImage(
+                    light_image=display_image,
+                    dark_image=display_image,
+                    size=(new_width, new_height)
+                )
+            else:
+                self.preview_image.configure(
+                    light_image=display_image,
+                    dark_image=display_image,
+                    size=(new_width, new_height)
+                )
 
             # Update label
-            self.preview_image = ctk_image  # Keep reference
             self.preview_label.configure(
-                image=ctk_image,
+                image=self.preview_image,
                 text="",
                 fg_color="transparent"
             )
+            self._last_preview_source = image
+            self._last_preview_size = (frame_width, frame_height)
         except Exception as e:
             self.activity_log.log(f"✗ Preview thumbnail update failed: {e}")
 
@@ -643,12 +666,11 @@ class ScanifyApp(ctk.CTk, tkdnd.TkinterDnD.DnDWrapper):
             messagebox.showwarning("Warning", "Please select an output directory")
             return
 
-        if not os.path.exists(output):
-            try:
-                os.makedirs(output)
-            except Exception as e:
-                messagebox.showerror("Error", f"Could not create output directory: {e}")
-                return
+        try:
+            Path(output).mkdir(parents=True, exist_ok=True)
+        except Exception as e:
+            messagebox.showerror("Error", f"Could not create output directory: {e}")
+            return
 
         # Disable UI
         self.is_processing = True
@@ -657,36 +679,95 @@ class ScanifyApp(ctk.CTk, tkdnd.TkinterDnD.DnDWrapper):
         self.activity_log.log("Starting conversion...")
 
         def conversion_thread():
-            total_files = len(self.processor.pdf_files)
-
-            for idx, pdf_path in enumerate(self.processor.pdf_files):
+            files = list(self.processor.pdf_files)
+            total_files = len(files)
+            # Per-file completion fractions, each pre-weighted by 1/total_files, and their running sum
+            file_progress = [0.0] * total_files
+            overall = [0.0]
+            progress_lock = threading.Lock()
+            inv_total = 1.0 / total_files
+
+            def convert_one(idx, pdf_path):
                 file_name = os.path.basename(pdf_path)
-                self.after(0, lambda f=file_name: self.activity_log.log(f"\n[{idx + 1}/{total_files}] Processing: {f}"))
+                self._progress_queue.put(('log', f"\n[{idx + 1}/{total_files}] Processing: {file_name}"))
+                inv_page = 0.0  # inv_total / page count, set on the first page
 
                 def progress_callback(current, total, message):
+                    nonlocal inv_page
                     if total > 0:
-                        progress_val = (idx / total_files) + (current / total / total_files)
-                        self.after(0, lambda p=progress_val: self.progress.set(p))
-                    self.after(0, lambda m=message: self.activity_log.log(m))
-
-                success = self.processor.convert_pdf(
+                        if not inv_page:
+                            inv_page = inv_total / total
+                        fraction = current * inv_page
+                        # Files report from several threads - add only this file's change
+                        with progress_lock:
+                            overall[0] += fraction - file_progress[idx]
+                            file_progress[idx] = fraction
+                            value = overall[0]
+                        self._progress_queue.put(('progress', value))
+                    # Files finish interleaved, so say which one the message is about
+                    self._progress_queue.put(('log', f"{file_name}: {message}"))
+
+                return self.processor.convert_pdf(
                     pdf_path,
                     output,
                     self.config,
                     progress_callback
                 )
 
-                if not success:
-                    self.after(0, lambda f=file_name: self.activity_log.log(f"Failed: {f}"))
+            # Convert several PDFs at once, bounded by core count and MAX_CONVERT_WORKERS
+            workers = max(1, min(MAX_CONVERT_WORKERS, os.cpu_count() or 1, total_files))
+            pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="scanify-convert")
+            self._convert_pool = pool
+            try:
+                futures = {pool.submit(convert_one, idx, path): path for idx, path in enumerate(files)}
+                for future in as_completed(futures):
+                    file_name = os.path.basename(futures[future])
+                    try:
+                        success = future.result()
+                    except Exception:
+                        success = False
+                    if not success:
+                        self._progress_queue.put(('log', f"Failed: {file_name}"))
+            finally:
+                pool.shutdown(wait=False)
+                self._convert_pool = None
 
-            # Complete
-            self.after(0, lambda: self.progress.set(1.0))
-            self.after(0, lambda: self.activity_log.log("\n✓ All conversions completed!"))
-            self.after(0, lambda: self._set_ui_state(True))
-            self.after(0, lambda: setattr(self, 'is_processing', False))
+            self._progress_queue.put(('done', None))
 
         thread = threading.Thread(target=conversion_thread, daemon=True)
         thread.start()
+        self.after(50, self._flush_progress)
+
+    def _flush_progress(self):
+        """Apply queued conversion updates in one go, then reschedule until the batch is done."""
+        progress_val = None
+        messages = []
+        done = False
+        try:
+            for _ in range(100):
+                kind, value = self._progress_queue.get_nowait()
+                if kind == 'progress':
+                    progress_val = value
+                elif kind == 'log':
+                    messages.append(value)
+                else:
+                    done = True
+                    break
+        except queue.Empty:
+            pass
+
+        if progress_val is not None:
+            self.progress.set(progress_val)
+        if messages:
+            self.activity_log.log("\n".join(messages))
+
+        if done:
+            self.progress.set(1.0)
+            self.activity_log.log("\n✓ All conversions completed!")
+            self._set_ui_state(True)
+            self.is_processing = False
+        else:
+            self.after(50, self._flush_progress)
 
     def _set_ui_state(self, enabled: bool):
         """Enable or disable UI elements."""
@@ -705,15 +786,20 @@ class ScanifyApp(ctk.CTk, tkdnd.TkinterDnD.DnDWrapper):
     def _on_closing(self):
         """Handle window close."""
         if self.is_processing:
-            if messagebox.askyesno("Confirm", "Conversion in progress. Are you sure you want to exit?"):
-                self.destroy()
-        else:
-            self.destroy()
+            if not messagebox.askyesno("Confirm", "Conversion in progress. Are you sure you want to exit?"):
+                return
+            # Drop queued files so the converter threads don't keep the process alive
+            pool = self._convert_pool
+            if pool is not None:
+                pool.shutdown(wait=False, cancel_futures=True)
+        self.processor.close_all()
+        shutdown_pool()
+        self.destroy()
 
     def _check_for_updates(self):
         """Check for updates in background on startup."""
         try:
-            data = self._fetch_version_data()
+            data = self._load_cached_version_data() or self._fetch_version_data()
             if data:
                 latest_version = data.get('version', VERSION)
                 download_url = data.get('download_url', DOWNLOAD_URL)
@@ -732,9 +818,10 @@ class ScanifyApp(ctk.CTk, tkdnd.TkinterDnD.DnDWrapper):
             req = urllib.request.Request(VERSION_CHECK_URL)
             req.add_header('User-Agent', 'Scanify')
 
-            with urllib.request.urlopen(req, timeout=5) as response:
+            with urllib.request.urlopen(req, timeout=UPDATE_CHECK_TIMEOUT) as response:
                 if response.status == 200:
                     data = json.loads(response.read().decode())
+                    self._save_version_cache(data)
                     return data
         except urllib.error.HTTPError as e:
             if e.code == 404:
@@ -743,18 +830,41 @@ class ScanifyApp(ctk.CTk, tkdnd.TkinterDnD.DnDWrapper):
                 if bundled:
                     return bundled
         except urllib.error.URLError as e:
-            # Network error - try bundled version.json as fallback
-            bundled = self._load_bundled_version()
-            if bundled:
-                return bundled
+            # Network error - try last fetched or bundled version.json as fallback
+            fallback = self._load_cached_version_data(max_age=None) or self._load_bundled_version()
+            if fallback:
+                return fallback
         except Exception as e:
-            # Any other error - try bundled version.json as fallback
-            bundled = self._load_bundled_version()
-            if bundled:
-                return bundled
+            # Any other error - try last fetched or bundled version.json as fallback
+            fallback = self._load_cached_version_data(max_age=None) or self._load_bundled_version()
+            if fallback:
+                return fallback
 
         return None
 
+    def _load_cached_version_data(self, max_age=UPDATE_CACHE_TTL):
+        """Return version data cached on disk if younger than max_age seconds (any age if None), else None."""
+        try:
+            with open(UPDATE_CACHE_FILE, 'r') as f:
+                cached = json.load(f)
+            if max_age is None or time.time() - cached['ts'] < max_age:
+                return cached['data']
+        except Exception:
+            pass
+        return None
+
+    def _save_version_cache(self, data):
+        """Atomically write fetched version data to the on-disk cache."""
+        try:
+            UPDATE_CACHE_FILE.parent.mkdir(exist_ok=True)
+            tmp_file = UPDATE_CACHE_FILE.with_suffix('.tmp')
+            with open(tmp_file, 'w') as f:
+                json.dump({'ts': time.time(), 'data': data}, f)
+            os.replace(tmp_file, UPDATE_CACHE_FILE)
+        except Exception:
+            # Caching is best-effort
+            pass
+
     def _load_bundled_version(self):
         """Load version info from bundled version.json file."""
         try:
@@ -849,19 +959,11 @@ class ScanifyApp(ctk.CTk, tkdnd.TkinterDnD.DnDWrapper):
     def _compare_versions(self, v1, v2):
         """Compare version strings. Returns 1 if v1 > v2, -1 if v1 < v2, 0 if equal."""
         try:
-            parts1 = [int(x) for x in v1.split('.')]
-            parts2 = [int(x) for x in v2.split('.')]
-
-            for i in range(max(len(parts1), len(parts2))):
-                p1 = parts1[i] if i < len(parts1) else 0
-                p2 = parts2[i] if i < len(parts2) else 0
-                if p1 > p2:
-                    return 1
-                elif p1 < p2:
-                    return -1
-            return 0
-        except:
+            parts1 = _parse_version(v1)
+            parts2 = _parse_version(v2)
+        except (ValueError, AttributeError):
             return 0
+        return (parts1 > parts2) - (parts1 < parts2)
 
     def _show_about(self):
         """Show About dialog."""
@@ -889,14 +991,14 @@ class ScanifyApp(ctk.CTk, tkdnd.TkinterDnD.DnDWrapper):
         ctk.CTkLabel(
             content,
             text="📄 Scanify",
-            font=ctk.CTkFont(size=32, weight="bold")
+            font=get_font(32, "bold")
         ).pack(pady=(0, 10))
 
         # Version
         ctk.CTkLabel(
             content,
             text=f"Version {VERSION}\nMade By DrAayZee",
-            font=ctk.CTkFont(size=14),
+            font=get_font(14),
             text_color=COLOR_TEXT_SECONDARY
         ).pack(pady=(0, 20))
 
@@ -904,7 +1006,7 @@ class ScanifyApp(ctk.CTk, tkdnd.TkinterDnD.DnDWrapper):
         ctk.CTkLabel(
             content,
             text="Convert PDF documents to realistic scanned images",
-            font=ctk.CTkFont(size=13),
+            font=get_font(13),
             wraplength=440
         ).pack(pady=(0, 10))
 
@@ -925,7 +1027,7 @@ class ScanifyApp(ctk.CTk, tkdnd.TkinterDnD.DnDWrapper):
             ctk.CTkLabel(
                 features_frame,
                 text=feature,
-                font=ctk.CTkFont(size=11),
+                font=get_font(11),
                 anchor="w"
             ).pack(fill="x", padx=20, pady=5)
 
@@ -961,7 +1063,7 @@ class ScanifyApp(ctk.CTk, tkdnd.TkinterDnD.DnDWrapper):
         ctk.CTkLabel(
             content,
             text=f"© {datetime.now().year} Scanify\nReleased under MIT License",
-            font=ctk.CTkFont(size=10),
+            font=get_font(10),
             text_color=COLOR_TEXT_SECONDARY
         ).pack(pady=(20, 0))
 
@@ -1010,14 +1112,14 @@ class UpdateCheckerWindow(ctk.CTkToplevel):
         ctk.CTkLabel(
             main_frame,
             text="Checking for Updates...",
-            font=ctk.CTkFont(size=18, weight="bold")
+            font=get_font(18, "bold")
         ).pack(pady=(0, 20))
 
         # Progress indicator (spinner text)
         self.status_label = ctk.CTkLabel(
             main_frame,
             text="🔍 Connecting to server...",
-            font=ctk.CTkFont(size=12),
+            font=get_font(12),
             text_color=COLOR_TEXT_SECONDARY,
             wraplength=450
         )
@@ -1029,7 +1131,7 @@ class UpdateCheckerWindow(ctk.CTkToplevel):
 
         self.results_text = ctk.CTkTextbox(
             results_frame,
-            font=ctk.CTkFont(size=11),
+            font=get_font(11),
             border_width=0,
             text_color=COLOR_TEXT,
             fg_color=COLOR_CARD
@@ -1047,7 +1149,7 @@ class UpdateCheckerWindow(ctk.CTkToplevel):
             command=self._on_download,
             fg_color=COLOR_BUTTON_SUCCESS,
             hover_color="#218838",
-            font=ctk.CTkFont(size=11, weight="bold")
+            font=get_font(11, "bold")
         )
         self.download_btn.pack(side="left", padx=(0, 10))
         self.download_btn.configure(state="disabled")
@@ -1058,7 +1160,7 @@ class UpdateCheckerWindow(ctk.CTkToplevel):
             command=self.destroy,
             fg_color=COLOR_BUTTON,
             hover_color=COLOR_BUTTON_HOVER,
-            font=ctk.CTkFont(size=11)
+            font=get_font(11)
         )
         self.close_btn.pack(side="right")
 
@@ -1067,7 +1169,7 @@ class UpdateCheckerWindow(ctk.CTkToplevel):
     def log_status(self, message: str):
         """Add a status message to the results."""
         self.status_label.configure(text=message)
-        self.update()
+        self.update_idletasks()
 
     def add_result(self, text: str):
         """Add text to the results area."""
@@ -1075,7 +1177,7 @@ class UpdateCheckerWindow(ctk.CTkToplevel):
         self.results_text.insert("end", text + "\n")
         self.results_text.see("end")  # Scroll to bottom
         self.results_text.configure(state="disabled")
-        self.update()
+        self.update_idletasks()
 
     def set_result(self, title: str, body: str, is_success: bool = True):
         """Set the complete result message."""
@@ -1087,7 +1189,7 @@ class UpdateCheckerWindow(ctk.CTkToplevel):
         self.results_text.insert("end", body)
 
         self.results_text.configure(state="disabled")
-        self.update()
+        self.update_idletasks()
 
     def enable_download(self, url: str):
         """Enable download button and set URL."""
@@ -1107,4 +1209,5 @@ def main():
 
 
 if __name__ == "__main__":
+    multiprocessing.freeze_support()  # Page workers re-launch the frozen exe
     main()
@@ -10,6 +10,17 @@ from config import (
     COLOR_TEXT, COLOR_TEXT_SECONDARY, COLOR_INPUT_BG, BUTTON_HEIGHT
 )
 
+# Shared CTkFont objects, created on first use (a Tk root must exist by then)
+_FONTS = {}
+
+
+def get_font(size: int, weight: Optional[str] = None, family: Optional[str] = None) -> ctk.CTkFont:
+    """Return the shared CTkFont for a size/weight/family combination."""
+    key = (size, weight, family)
+    if key not in _FONTS:
+        _FONTS[key] = ctk.CTkFont(family=family, size=size, weight=weight)
+    return _FONTS[key]
+
 # ...existing code...
 
 # Restore FileQueueList class
@@ -21,6 +32,8 @@ class FileQueueList(ctk.CTkFrame):
         self.files = []
         self.selected_indices = set()
         self.labels = []
+        self._displayed = []  # Label texts currently shown, parallel to self.labels
+        self._last_selection = set()  # Indices currently drawn as selected
         self.height = height
         self._build_ui()
 
@@ -28,38 +41,45 @@ class FileQueueList(ctk.CTkFrame):
         self.list_frame = ctk.CTkFrame(self, fg_color="transparent")
         self.list_frame.pack(fill="both", expand=True)
         self.list_frame.configure(height=self.height)
+        self.empty_label = ctk.CTkLabel(self.list_frame, text="No files in queue", font=get_font(11), anchor="w", fg_color=COLOR_INPUT_BG, text_color=COLOR_TEXT_SECONDARY)
 
     def update_files(self, files: list):
         self.files = files
         self.selected_indices = set()
-        # Remove old labels
-        for lbl in self.labels:
+        texts = [f"{i}. {os.path.basename(file)}" for i, file in enumerate(files, 1)]
+        # Recycle existing rows - a label's row index never changes, so its click bindings stay valid
+        for i, text in enumerate(texts[:len(self.labels)]):
+            if self._displayed[i] != text:
+                self.labels[i].configure(text=text)
+                self._displayed[i] = text
+        for lbl in self.labels[len(texts):]:
             lbl.destroy()
-        self.labels = []
-        if files:
-            for i, file in enumerate(files, 1):
-                fname = os.path.basename(file)
-                lbl = ctk.CTkLabel(self.list_frame, text=f"{i}. {fname}", font=ctk.CTkFont(size=11), anchor="w", fg_color=COLOR_INPUT_BG, text_color=COLOR_TEXT)
-                lbl.pack(fill="x", padx=2, pady=1)
-                lbl.bind("<Button-1>", lambda e, idx=i-1: self._on_click(e, idx))
-                lbl.bind("<Control-Button-1>", lambda e, idx=i-1: self._on_ctrl_click(e, idx))
-                lbl.bind("<Shift-Button-1>", lambda e, idx=i-1: self._on_shift_click(e, idx))
-                self.labels.append(lbl)
-        else:
-            lbl = ctk.CTkLabel(self.list_frame, text="No files in queue", font=ctk.CTkFont(size=11), anchor="w", fg_color=COLOR_INPUT_BG, text_color=COLOR_TEXT_SECONDARY)
+        del self.labels[len(texts):]
+        del self._displayed[len(texts):]
+        for i in range(len(self.labels), len(texts)):
+            lbl = ctk.CTkLabel(self.list_frame, text=texts[i], font=get_font(11), anchor="w", fg_color=COLOR_INPUT_BG, text_color=COLOR_TEXT)
             lbl.pack(fill="x", padx=2, pady=1)
+            lbl.bind("<Button-1>", lambda e, idx=i: self._on_click(e, idx))
+            lbl.bind("<Control-Button-1>", lambda e, idx=i: self._on_ctrl_click(e, idx))
+            lbl.bind("<Shift-Button-1>", lambda e, idx=i: self._on_shift_click(e, idx))
             self.labels.append(lbl)
+            self._displayed.append(texts[i])
+        if files:
+            self.empty_label.pack_forget()
+        else:
+            self.empty_label.pack(fill="x", padx=2, pady=1)
         self._highlight_selection()
 
     def _highlight_selection(self):
-        for idx, lbl in enumerate(self.labels):
-            if self.files and idx < len(self.files):
-                if idx in self.selected_indices:
-                    lbl.configure(fg_color="#3399FF", text_color="white")
-                else:
-                    lbl.configure(fg_color=COLOR_INPUT_BG, text_color=COLOR_TEXT)
+        # Only rows whose selection state changed need restyling
+        for idx in self.selected_indices ^ self._last_selection:
+            if idx >= len(self.labels):
+                continue
+            if idx in self.selected_indices:
+                self.labels[idx].configure(fg_color="#3399FF", text_color="white")
             else:
-                lbl.configure(fg_color=COLOR_INPUT_BG, text_color=COLOR_TEXT_SECONDARY)
+                self.labels[idx].configure(fg_color=COLOR_INPUT_BG, text_color=COLOR_TEXT)
+        self._last_selection = set(self.selected_indices)
 
     def _on_click(self, event, index):
         if 0 <= index < len(self.files):
@@ -113,7 +133,7 @@ class Card(ctk.CTkFrame):
             self.title_label = ctk.CTkLabel(
                 self,
                 text=title,
-                font=ctk.CTkFont(size=15, weight="bold"),
+                font=get_font(15, "bold"),
                 text_color=COLOR_TEXT
             )
             self.title_label.pack(pady=(CARD_PADDING, CARD_PADDING-3), padx=CARD_PADDING, anchor="w")
@@ -137,6 +157,11 @@ class SliderCard(Card):
 
         self.command = command
         self.step = step
+        self._last_value = default_val
+
+        # Fixed per slider, so work them out once rather than on every drag event
+        self._inv_step = 1.0 / step
+        self._fmt = "{:.0f}" if step >= 1 else "{:.2f}"
 
         # Single row: Label, Slider, Value
         content = ctk.CTkFrame(self, fg_color="transparent")
@@ -146,7 +171,7 @@ class SliderCard(Card):
         self.label = ctk.CTkLabel(
             content,
             text=label,
-            font=ctk.CTkFont(size=12, weight="bold"),
+            font=get_font(12, "bold"),
             text_color=COLOR_TEXT,
             width=80,
             anchor="w"
@@ -158,7 +183,7 @@ class SliderCard(Card):
             content,
             from_=min_val,
             to=max_val,
-            number_of_steps=int((max_val - min_val) / step),
+            number_of_steps=round((max_val - min_val) * self._inv_step),
             command=self._on_slider_change,
             height=16
         )
@@ -169,7 +194,7 @@ class SliderCard(Card):
         self.value_label = ctk.CTkLabel(
             content,
             text=self._format_value(default_val),
-            font=ctk.CTkFont(size=12, weight="bold"),
+            font=get_font(12, "bold"),
             text_color=COLOR_TEXT_SECONDARY,
             width=50,
             anchor="e"
@@ -178,37 +203,27 @@ class SliderCard(Card):
 
     def _format_value(self, value: float) -> str:
         """Format value for display."""
-        if self.step >= 1:
-            return f"{int(value)}"
-        else:
-            return f"{value:.2f}"
+        return self._fmt.format(value)
 
     def _on_slider_change(self, value: float):
         """Handle slider change."""
         # Round to step
-        rounded = round(value / self.step) * self.step
+        rounded = round(value * self._inv_step) * self.step
         self.value_label.configure(text=self._format_value(rounded))
-        if self.command:
+        # Apply right away so Preview/Convert always see the shown value; skip moves within one step
+        if self.command and rounded != self._last_value:
+            self._last_value = rounded
             self.command(rounded)
 
     def get(self) -> float:
         """Get current slider value."""
         value = self.slider.get()
-        return round(value / self.step) * self.step
-
-    def set(self, value: float):
-        """Set slider value."""
-        self.slider.set(value)
-        self.value_label.configure(text=self._format_value(value))
-        return [self.files[i] for i in sorted(self.selected_indices)]
-    def get(self) -> float:
-        """Get current slider value."""
-        value = self.slider.get()
-        return round(value / self.step) * self.step
+        return round(value * self._inv_step) * self.step
 
     def set(self, value: float):
         """Set slider value."""
         self.slider.set(value)
+        self._last_value = value
         self.value_label.configure(text=self._format_value(value))
 
 
@@ -222,7 +237,7 @@ class ActivityLog(ctk.CTkTextbox):
     def __init__(self, parent, **kwargs):
         super().__init__(
             parent,
-            font=ctk.CTkFont(size=10, family="Consolas"),
+            font=get_font(10, family="Consolas"),
             wrap="word",
             fg_color=COLOR_INPUT_BG,
             border_width=1,
@@ -233,7 +248,7 @@ class ActivityLog(ctk.CTkTextbox):
         self.configure(state="disabled")
 
     def log(self, message: str):
-        """Add message to log."""
+        """Add message to log (callers batch bursts, e.g. conversion progress, into one call)."""
         self.configure(state="normal")
         self.insert("end", f"{message}\n")
         self.see("end")